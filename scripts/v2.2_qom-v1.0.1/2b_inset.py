@@ -3,14 +3,14 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui import init_log
 from qom.ui.plotters import MPLPlotter
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system and solver
 from systems.MiddleMembrane import MM_01
+from solvers.deterministic import CorrelationSolver
 
 # all parameters
 params = {
@@ -62,7 +62,7 @@ system = MM_01(
 )
 
 # get mechanical momentum variances
-hle_solver = HLESolver(
+hle_solver = CorrelationSolver(
     system=system,
     params=params['solver']
 )
@@ -71,12 +71,13 @@ M_0 = hle_solver.get_corr_indices().transpose()[0]
 
 # initialize system with RWA
 params['system']['t_rwa'] = True
+params['solver']['ode_method'] = 'expm'
 system = MM_01(
     params=params['system']
 )
 
 # get mechanical momentum variances
-M_1 = HLESolver(
+M_1 = CorrelationSolver(
     system=system,
     params=params['solver']
 ).get_corr_indices().transpose()[0]
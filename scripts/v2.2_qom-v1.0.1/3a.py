@@ -4,27 +4,28 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import get_Wigner_distributions_single_mode
 from qom.ui import init_log
 from qom.ui.plotters import MPLPlotter
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system and solver
 from systems.MiddleMembrane import MM_01
+from solvers.deterministic import CorrelationSolver
+from solvers.measure import get_Wigner_distributions_single_mode
 
 # frequently used variables
 _max = 3
 _dim = 601
+_pos = 1
 
 # all parameters
 params = {
     'solver': {
         'show_progress' : True,
         'cache'         : False,
-        'ode_method'    : 'vode',
-        'indices'       : [1],
+        'ode_method'    : 'expm',
+        'indices'       : [(2, 2)],
         'wigner_xs'     : np.linspace(-_max, _max, _dim),
         'wigner_ys'     : np.linspace(-_max, _max, _dim),
         't_min'         : 0.0,
@@ -77,20 +78,25 @@ system = MM_01(
 )
 
 # get times and correlations
-hle_solver = HLESolver(
+corr_solver = CorrelationSolver(
     system=system,
     params=params['solver']
 )
-T = hle_solver.get_times()
-_, Corrs = hle_solver.get_modes_corrs()
-# get Wigner distributions
+T = corr_solver.get_times()
+Corrs = corr_solver.get_corrs()
+# get Wigner distributions of the plotted frames
+frames = list(range(0, len(T), 5))
 Wigners = get_Wigner_distributions_single_mode(
-    Corrs=Corrs,
-    params=params['solver']
+    corrs=Corrs,
+    xs=params['solver']['wigner_xs'],
+    ys=params['solver']['wigner_ys'],
+    pos=_pos,
+    frames=frames,
+    dtype=np.float32
 )
 
 # plotter
-for i in range(0, len(T), 5):
+for j, i in enumerate(frames):
     params['plotter']['title'] = '$\\omega_{:} t = {:0.1f}$'.format('m', T[i])
     plotter = MPLPlotter(
         axes={
@@ -99,7 +105,8 @@ for i in range(0, len(T), 5):
         },
         params=params['plotter']
     )
+    # each distribution has shape (len(ys), len(xs)), with P along the rows and Q along the columns of the contour
     plotter.update(
-        vs=Wigners[i, 0]
+        vs=Wigners[j]
     )
     plotter.show()
\ No newline at end of file
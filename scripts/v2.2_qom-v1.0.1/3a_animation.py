@@ -0,0 +1,78 @@
+# dependencies
+import numpy as np
+import os
+import sys
+
+# qom modules
+from qom.ui import init_log
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system, solver and utilities
+from systems.MiddleMembrane import MM_01
+from solvers.deterministic import CorrelationSolver
+from utils.animation import WignerAnimation
+
+# frequently used variables
+_max = 3
+_dim = 601
+
+# all parameters
+params = {
+    'solver': {
+        'show_progress' : True,
+        'cache'         : False,
+        'ode_method'    : 'expm',
+        'indices'       : [(2, 2)],
+        't_min'         : 0.0,
+        't_max'         : 200.0,
+        't_dim'         : 2001,
+        't_index_min'   : 0,
+        't_index_max'   : 2001,
+    },
+    'system': {
+        'alphas'        : [2.0, 0.2, 0.2],
+        'betas'         : [100.0, 25.0, 25.0],
+        'Delta_norm'    : 1.0,
+        'g_norm'        : 1e-4,
+        'gamma_norm'    : 1e-6,
+        'kappa_norm'    : 0.1,
+        'ns'            : [0.0, 10.0],
+        'Omega_norms'   : [2.0, 2.0],
+        't_rwa'         : True
+    },
+    'animation': {
+        'show_progress' : True,
+        'file_path'     : 'data/v2.2_qom-v1.0.1/3a_wigner',
+        'xs'            : np.linspace(-_max, _max, _dim),
+        'ys'            : np.linspace(-_max, _max, _dim),
+        'pos'           : 1,
+        'width'         : 2.75,
+        'height'        : 2.5
+    }
+}
+
+if __name__ == '__main__':
+    # initialize logger
+    init_log()
+
+    # initialize system with RWA
+    params['system']['t_rwa'] = True
+    system = MM_01(
+        params=params['system']
+    )
+
+    # get times and correlations, propagated exactly for the constant matrices under RWA
+    corr_solver = CorrelationSolver(
+        system=system,
+        params=params['solver']
+    )
+    T = corr_solver.get_times()
+    Corrs = corr_solver.get_corrs()
+
+    # export frames as an image sequence, or as a video with FFmpeg if the file path ends with ".mp4"
+    WignerAnimation(
+        corrs=Corrs,
+        T=T,
+        params=params['animation']
+    ).export()
@@ -4,14 +4,15 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
 from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system, solver and utilities
 from systems.MiddleMembrane import MM_01
+from solvers.stationary import FloquetSolver, LyapunovSolver
+from utils.cache import PointCache
 
 # all parameters
 params = {
@@ -96,22 +97,34 @@ def func_rat_var(system_params):
     )
 
     # get mechanical position variance
-    var = np.min(HLESolver(
-        system=system,
-        params=params['solver']
-    ).get_corr_indices()[:, 0])
+    if system.is_A_constant:
+        var = LyapunovSolver(
+            system=system,
+            params=params['solver']
+        ).get_corr_indices()[0]
+    else:
+        var = np.min(FloquetSolver(
+            system=system,
+            params={**params['solver'], 'ode_method': 'DOP853', 'period': 2.0 * np.pi / system_params['Omega_norms'][0]}
+        ).get_corr_indices()[:, 0])
 
     # update results
     return np.array([rat, var], dtype=np.float_)
 
 if __name__ == '__main__':
+    # cache individual points
+    cached_func_rat_var = PointCache().wrap(
+        func=func_rat_var,
+        params_solver=params['solver']
+    )
+
     # low thermal phonons with RWA
     params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/4a_rwa_n=10.0'
     params['system']['ns'][1] = 10.0
     params['system']['t_rwa'] = True
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func_rat_var,
+        func=cached_func_rat_var,
         params=params['looper'],
         params_system=params['system'],
         plot=False
@@ -124,7 +137,7 @@ if __name__ == '__main__':
     params['system']['t_rwa'] = True
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func_rat_var,
+        func=cached_func_rat_var,
         params=params['looper'],
         params_system=params['system'],
         plot=False
@@ -137,7 +150,7 @@ if __name__ == '__main__':
     params['system']['t_rwa'] = False
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func_rat_var,
+        func=cached_func_rat_var,
         params=params['looper'],
         params_system=params['system'],
         plot=False
@@ -150,7 +163,7 @@ if __name__ == '__main__':
     params['system']['t_rwa'] = False
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func_rat_var,
+        func=cached_func_rat_var,
         params=params['looper'],
         params_system=params['system'],
         plot=False
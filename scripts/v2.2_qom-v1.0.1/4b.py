@@ -4,14 +4,15 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
 from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system, solver and utilities
 from systems.MiddleMembrane import MM_01
+from solvers.deterministic import CorrelationSolver
+from utils.cache import PointCache
 
 # all parameters
 params = {
@@ -33,7 +34,14 @@ params = {
         't_max'         : 1000.0,
         't_dim'         : 10001,
         't_index_min'   : 9371,
-        't_index_max'   : 10001
+        't_index_max'   : 10001,
+        'ss_tol'        : 1e-7,
+        'ss_period'     : np.pi,
+        'store_corrs'   : False,
+        'reduce'        : {
+            '(2, 2)'    : 'min',
+            '(3, 3)'    : 'min'
+        }
     },
     'system': {
         'alphas'        : [2.0, 0.2, 0.2],
@@ -99,10 +107,11 @@ def func_rat_n_beta(system_params):
     )
 
     # get mechanical position and momentum variances
-    var_q, var_p = np.min(HLESolver(
+    reduced = CorrelationSolver(
         system=system,
         params=params['solver']
-    ).get_corr_indices(), axis=0)
+    ).get_reduced()
+    var_q, var_p = reduced['(2, 2)'], reduced['(3, 3)']
 
     # calculate hyperbolic angles
     r = np.arctanh(rat)
@@ -116,12 +125,18 @@ def func_rat_n_beta(system_params):
     return np.array([rat, n_beta], dtype=np.float_)
 
 if __name__ == '__main__':
+    # cache individual points
+    cached_func_rat_n_beta = PointCache().wrap(
+        func=func_rat_n_beta,
+        params_solver=params['solver']
+    )
+
     # low thermal phonons
     params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/4b_n=10.0'
     params['system']['ns'][1] = 10.0
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func_rat_n_beta,
+        func=cached_func_rat_n_beta,
         params=params['looper'],
         params_system=params['system'],
         plot=False
@@ -133,7 +148,7 @@ if __name__ == '__main__':
     params['system']['ns'][1] = 1000.0
     looper = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func_rat_n_beta,
+        func=cached_func_rat_n_beta,
         params=params['looper'],
         params_system=params['system'],
         plot=False
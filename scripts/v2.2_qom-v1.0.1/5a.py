@@ -4,14 +4,15 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
-from systems.MiddleMembrane import MM_01
+# import system, solver and utilities
+from systems.MiddleMembrane import MM_01_Batch
+from solvers.stationary import LyapunovSolver
+from utils.loopers import get_axis_values, get_file_path
+from utils.store import load_values, save_sweep
 
 # all parameters
 params = {
@@ -84,60 +85,65 @@ params = {
     }
 }
 
-# function to calculate the ratio and variances
-def func_rat_var(system_params):
-    # update parameters
-    val = system_params['beta_pm_sum']
-    system_params['betas'][1] = val / 2.0
-    system_params['betas'][2] = val / 2.0
+# function to calculate the ratios and variances over the grid
+def func_rat_var(system_params, params_axes):
+    # update parameters, with the values of the Y-axis along the rows
+    xs = get_axis_values(params_axes['X'])
+    ys = get_axis_values(params_axes['Y'])
+    system_params = dict(system_params)
+    system_params['betas'] = [system_params['betas'][0], xs[None, :] / 2.0, xs[None, :] / 2.0]
+    system_params['kappa_norm'] = ys[:, None]
 
-    # initialize system
-    system = MM_01(
+    # initialize batch of systems
+    system = MM_01_Batch(
         params=system_params
     )
 
     # get derived constants and controls
     _, _, c = system.get_ivc()
-    
-    # get squeezing ratio
-    rat = system.get_params_ratio(
+
+    # get squeezing ratios
+    rats = np.broadcast_to(system.get_params_ratio(
         c=c
-    )
+    ), system.shape)
 
-    # get mechanical position variances
-    var = np.min(HLESolver(
+    # get mechanical position variances of all the points together
+    vars = LyapunovSolver(
         system=system,
         params=params['solver']
-    ).get_corr_indices(), axis=0)[0]
+    ).get_corr_indices()[..., 0]
 
     # update results
-    return np.array([rat, var], dtype=np.float_)
+    return np.stack([rats, vars], axis=-1)
+
+# function to obtain the stored results or to calculate and store them
+def get_V(file_path_prefix, system_params):
+    file_path = get_file_path(
+        file_path_prefix=file_path_prefix,
+        params_axes=params['looper']
+    )
+    if not os.path.isdir(file_path[:-4]) and not os.path.isfile(file_path):
+        save_sweep(
+            store_path=file_path[:-4],
+            X=get_axis_values(params['looper']['X']),
+            Y=get_axis_values(params['looper']['Y']),
+            V=func_rat_var(system_params, params['looper']),
+            params={'X': params['looper']['X'], 'Y': params['looper']['Y'], 'system': system_params, 'solver': params['solver']}
+        )
+
+    return load_values(file_path)
 
 if __name__ == '__main__':
     # low thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/5_n=10.0'
     params['system']['ns'][1] = 10.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
-    )
-    xs = looper.axes['Y']['val']
-    _, vs_0 = np.min(looper.results['V'], axis=1).transpose()
+    V = get_V('data/v2.2_qom-v1.0.1/5_n=10.0', params['system'])
+    xs = get_axis_values(params['looper']['Y'])
+    _, vs_0 = np.min(V, axis=1).transpose()
 
     # high thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/5_n=1000.0'
     params['system']['ns'][1] = 1000.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
-    )
-    _, vs_1 = np.min(looper.results['V'], axis=1).transpose()
+    V = get_V('data/v2.2_qom-v1.0.1/5_n=1000.0', params['system'])
+    _, vs_1 = np.min(V, axis=1).transpose()
 
     # plotter
     plotter = MPLPlotter(
@@ -4,14 +4,16 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system, solver and utilities
 from systems.MiddleMembrane import MM_01
+from solvers.stationary import LyapunovSolver
+from utils.cache import PointCache
+from utils.loopers import AdaptiveXYLooper
+from utils.optimizers import SteadyStateOptimizer
 
 # all parameters
 params = {
@@ -21,7 +23,7 @@ params = {
             'var'   : 'beta_pm_sum',
             'min'   : 75,
             'max'   : 225,
-            'dim'   : 301
+            'dim'   : 31
         },
         'Y'             : {
             'var'   : 'kappa_norm',
@@ -29,7 +31,18 @@ params = {
             'max'   : 1e0,
             'dim'   : 151,
             'scale' : 'log'
-        }
+        },
+        'v_index'       : 1,
+        'v_mode'        : 'min'
+    },
+    'optimizer': {
+        'vars'          : [{
+            'var'   : 'beta_pm_sum',
+            'min'   : 75,
+            'max'   : 225
+        }],
+        'index'         : (2, 2),
+        'objective'     : 'lyapunov'
     },
     'solver': {
         'show_progress' : False,
@@ -105,41 +118,67 @@ def func_rat_var(system_params):
     )
 
     # get mechanical position variances
-    var = np.min(HLESolver(
+    var = LyapunovSolver(
         system=system,
         params=params['solver']
-    ).get_corr_indices()[:, 0])
+    ).get_corr_indices()[0]
 
     # update results
     return np.array([rat, var], dtype=np.float_)
 
+# function to initialize the system with the sum of the amplitudes split equally
+def get_system(params):
+    params = dict(params)
+    params['betas'] = [params['betas'][0], params['beta_pm_sum'] / 2.0, params['beta_pm_sum'] / 2.0]
+
+    return MM_01(
+        params=params
+    )
+
+# function to refine the optimum in the bracket using the gradients of the steady state
+def refine_beta_pm_sum(system_params, x_min, x_max):
+    # update parameters
+    params_optimizer = dict(params['optimizer'])
+    params_optimizer['vars'] = [dict(params['optimizer']['vars'][0], min=x_min, max=x_max)]
+    system_params = dict(system_params)
+    system_params['beta_pm_sum'] = (x_min + x_max) / 2.0
+
+    # optimize
+    results = SteadyStateOptimizer(
+        system_class=get_system,
+        params=params_optimizer,
+        params_system=system_params
+    ).optimize()
+
+    return results['xs'][0], results['num_evals']
+
 if __name__ == '__main__':
+    # cache individual points
+    cached_func_rat_var = PointCache().wrap(
+        func=func_rat_var,
+        params_solver=params['solver']
+    )
+    # refine the optima with the optimizer
+    params['looper']['refine'] = refine_beta_pm_sum
+
     # low thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/5_n=10.0'
     params['system']['ns'][1] = 10.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
+    looper = AdaptiveXYLooper(
+        func=cached_func_rat_var,
         params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_system=params['system']
     )
     xs = looper.axes['Y']['val']
-    _, _idxs_0 = np.argmin(looper.results['V'], axis=1).transpose()
-    vs_0 = np.transpose(looper.results['V'])[0, _idxs_0, 0]
+    vs_0 = looper.loop()['V'][:, 0]
 
     # high thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/5_n=1000.0'
     params['system']['ns'][1] = 1000.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
+    looper = AdaptiveXYLooper(
+        func=cached_func_rat_var,
         params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_system=params['system']
     )
-    _, _idxs_1 = np.argmin(looper.results['V'], axis=1).transpose()
-    vs_1 = np.transpose(looper.results['V'])[0, _idxs_1, 0]
+    vs_1 = looper.loop()['V'][:, 0]
 
     # plotter
     plotter = MPLPlotter(
@@ -4,14 +4,14 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
 from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system and solver
 from systems.MiddleMembrane import MM_01
+from solvers.deterministic import CorrelationSolver
 
 # all parameters
 params = {
@@ -34,7 +34,13 @@ params = {
         't_max'         : 1000.0,
         't_dim'         : 10001,
         't_index_min'   : 9371,
-        't_index_max'   : 10001
+        't_index_max'   : 10001,
+        'ss_tol'        : 1e-7,
+        'ss_period'     : np.pi,
+        'store_corrs'   : False,
+        'reduce'        : {
+            '(2, 2)'    : 'mean'
+        }
     },
     'system': {
         'alphas'        : [2.0, 0.2, 0.2],
@@ -94,10 +100,10 @@ def func_rat_vars(system_params):
     )
 
     # get mechanical position variances
-    var = np.mean(HLESolver(
+    var = CorrelationSolver(
         system=system,
         params=params['solver']
-    ).get_corr_indices()[:, 0])
+    ).get_reduced()['(2, 2)']
 
     # get steady state variance
     var_ss = system.get_var_Q_ss_rwa(
@@ -106,7 +112,8 @@ def func_rat_vars(system_params):
 
     # get variance from FT
     var_ft = system.get_var_Q_ft_rwa(
-        c=c
+        c=c,
+        method='rational'
     )
 
     # update results
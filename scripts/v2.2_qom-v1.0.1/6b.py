@@ -5,13 +5,13 @@ import sys
 
 # qom modules
 from qom.ui import init_log
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system and solver
 from systems.MiddleMembrane import MM_01
+from solvers.deterministic import CorrelationSolver
 
 # frequently used variables
 rat = 0.93
@@ -72,7 +72,7 @@ system = MM_01(
     params=params['system']
 )
 # initialize solver
-hle_solver = HLESolver(
+hle_solver = CorrelationSolver(
     system=system,
     params=params['solver']
 )
@@ -82,11 +82,12 @@ M_0 = hle_solver.get_corr_indices().transpose()[0]
 
 # initialize system with RWA
 params['system']['t_rwa'] = True
+params['solver']['ode_method'] = 'expm'
 system = MM_01(
     params=params['system']
 )
 # initialize solver
-hle_solver = HLESolver(
+hle_solver = CorrelationSolver(
     system=system,
     params=params['solver']
 )
@@ -106,7 +107,8 @@ M_3 = [system.get_var_Q_ss_rwa(
 
 # get numerical value
 M_4 = [system.get_var_Q_ft_rwa(
-    c=c
+    c=c,
+    method='rational'
 )] * len(T)
 
 # plotter
@@ -4,14 +4,15 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system, solver and utilities
 from systems.MiddleMembrane import MM_01
+from solvers.stationary import LyapunovSolver
+from utils.loopers import DistributedXYLooper
+from utils.thermal import ThermalFunction
 
 # all parameters
 params = {
@@ -30,7 +31,8 @@ params = {
             'max'   : 1e5,
             'dim'   : 81,
             'scale' : 'log'
-        }
+        },
+        'tile_shape'    : (None, 1)
     },
     'solver': {
         'show_progress' : False,
@@ -106,37 +108,44 @@ def func_rat_entan_ln(system_params):
     )
 
     # get mechanical position variance
-    var = np.mean(HLESolver(
+    var = LyapunovSolver(
         system=system,
         params=params['solver']
-    ).get_corr_indices(), axis=0)[0]
+    ).get_corr_indices()[0]
 
     return np.array([rat, var])
 
 if __name__ == '__main__':
+    # run with the argument "--worker" on the other nodes to evaluate the queued tiles
+    params['looper']['role'] = 'worker' if '--worker' in sys.argv else 'coordinator'
+    # header of the data stores
+    params['looper']['metadata'] = {'solver': params['solver']}
+    # superpose the results at the basis of the thermal occupancies
+    thermal_func_rat_entan_ln = ThermalFunction(
+        func_basis=func_rat_entan_ln
+    )
+
     # low kappa
     params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/7a_kappa=0.1'
     params['system']['kappa_norm'] = 0.1
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_entan_ln,
+    looper = DistributedXYLooper(
+        func=thermal_func_rat_entan_ln,
         params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_system=params['system']
     )
+    looper.loop()
     xs  = looper.axes['Y']['val']
     vars_0 = np.min(looper.results['V'], axis=1).transpose()[1]
 
     # high kappa
     params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/7a_kappa=1.0'
     params['system']['kappa_norm'] = 1.0
-    looper  = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_entan_ln,
+    looper = DistributedXYLooper(
+        func=thermal_func_rat_entan_ln,
         params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_system=params['system']
     )
+    looper.loop()
     vars_1 = np.min(looper.results['V'], axis=1).transpose()[1]
 
     # plotter
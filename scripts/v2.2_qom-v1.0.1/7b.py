@@ -4,15 +4,14 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import QCMSolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
-# import system
+# import system, solver and utilities
 from systems.MiddleMembrane import MM_01
+from solvers.stationary import LyapunovSolver
+from utils.loopers import DistributedXYLooper
 
 # all parameters
 params = {
@@ -35,15 +34,7 @@ params = {
     },
     'solver': {
         'show_progress' : False,
-        'cache'         : True,
-        'ode_method'    : 'vode',
-        'measure_codes' : ['entan_ln'],
-        'indices'       : (0, 1),
-        't_min'         : 0.0,
-        't_max'         : 1000.0,
-        't_dim'         : 10001,
-        't_index_min'   : 9371,
-        't_index_max'   : 10001
+        'measure_codes' : ['entan_ln']
     },
     'system': {
         'alphas'        : [2.0, 0.2, 0.2],
@@ -108,44 +99,41 @@ def func_rat_entan_ln(system_params):
         c=c
     )
 
-    # get modes, correlations and times
-    Modes, Corrs = HLESolver(
+    # get steady-state entanglement
+    eln = LyapunovSolver(
         system=system,
         params=params['solver']
-    ).get_modes_corrs()
-    # get entanglement
-    eln = np.mean(QCMSolver(
-        Modes=Modes,
-        Corrs=Corrs,
-        params=params['solver']
-    ).get_measures(), axis=0)[0]
+    ).get_measures()[0]
 
     return np.array([rat, eln])
 
 if __name__ == '__main__':
+    # run with the argument "--worker" on the other nodes to evaluate the queued tiles
+    params['looper']['role'] = 'worker' if '--worker' in sys.argv else 'coordinator'
+    # header of the data stores
+    params['looper']['metadata'] = {'solver': params['solver']}
+
     # low kappa
     params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/7b_kappa=0.1'
     params['system']['kappa_norm'] = 0.1
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
+    looper = DistributedXYLooper(
         func=func_rat_entan_ln,
         params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_system=params['system']
     )
+    looper.loop()
     xs = looper.axes['Y']['val']
     elns_0 = np.max(looper.results['V'], axis=1).transpose()[1]
 
     # high kappa
     params['looper']['file_path_prefix'] = 'data/v2.2_qom-v1.0.1/7b_kappa=1.0'
     params['system']['kappa_norm'] = 1.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
+    looper = DistributedXYLooper(
         func=func_rat_entan_ln,
         params=params['looper'],
-        params_system=params['system'],
-        plot=False
+        params_system=params['system']
     )
+    looper.loop()
     elns_1 = np.max(looper.results['V'], axis=1).transpose()[1]
 
     # plotter
@@ -0,0 +1,758 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to integrate the quantum correlations of linearized systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import ast
+import numpy as np
+import scipy.integrate as si
+import scipy.interpolate as si_interp
+import scipy.linalg as sl
+
+# local modules
+from solvers.measure import get_log_negativity
+
+def get_packed_indices(dim):
+    """Function to obtain the indices to pack and unpack the flattened upper-triangular entries of symmetric matrices.
+
+    Parameters
+    ----------
+    dim : int
+        Dimension of the matrices.
+
+    Returns
+    -------
+    idxs_pack : numpy.ndarray
+        Indices of the ``dim * (dim + 1) / 2`` upper-triangular entries in the flattened matrices, in row-major order.
+    idxs_unpack : numpy.ndarray
+        Indices of the packed entries for each of the ``dim**2`` entries in the flattened matrices.
+    """
+
+    # upper-triangular entries
+    rows, cols = np.triu_indices(dim)
+
+    # packed entry of each entry
+    idxs_unpack = np.empty((dim, dim), dtype=np.int_)
+    idxs_unpack[rows, cols] = np.arange(len(rows))
+    idxs_unpack[cols, rows] = np.arange(len(rows))
+
+    return rows * dim + cols, idxs_unpack.ravel()
+
+def get_packed_corrs(corrs):
+    """Function to pack symmetric correlation matrices into their upper-triangular entries.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray
+        Correlation matrices with shape ``(..., dim, dim)``.
+
+    Returns
+    -------
+    corrs_packed : numpy.ndarray
+        Packed correlations with shape ``(..., dim * (dim + 1) / 2)``.
+    """
+
+    # extract frequently used variables
+    corrs = np.asarray(corrs)
+    dim = corrs.shape[-1]
+    idxs_pack, _ = get_packed_indices(dim)
+
+    return np.reshape(corrs, corrs.shape[:-2] + (dim**2, ))[..., idxs_pack]
+
+def get_unpacked_corrs(corrs_packed):
+    """Function to unpack the upper-triangular entries of symmetric correlation matrices.
+
+    Parameters
+    ----------
+    corrs_packed : numpy.ndarray
+        Packed correlations with shape ``(..., dim * (dim + 1) / 2)``.
+
+    Returns
+    -------
+    corrs : numpy.ndarray
+        Correlation matrices with shape ``(..., dim, dim)``.
+    """
+
+    # extract frequently used variables
+    corrs_packed = np.asarray(corrs_packed)
+    dim = int(round((np.sqrt(8 * corrs_packed.shape[-1] + 1) - 1) / 2))
+    _, idxs_unpack = get_packed_indices(dim)
+
+    return np.reshape(corrs_packed[..., idxs_unpack], corrs_packed.shape[:-1] + (dim, dim))
+
+class BatchHLESolver():
+    r"""Class to integrate the quadrature correlations of a batch of systems together.
+
+    The correlations of all the systems in the batch are stacked into a single array of shape ``(N, 2n, 2n)`` and advanced together by a fixed-step fourth-order Runge-Kutta integrator of :math:`\dot{V} = A V + V A^{T} + D`, where the products are evaluated with ``numpy.matmul`` over the stack.
+
+    The batch amortizes the Python overhead of each step over many systems sharing the same times, which pays off for sweeps of time-dependent systems. A single trajectory is better integrated by :class:`CorrelationSolver`, which propagates constant matrices exactly and adapts its step size otherwise.
+
+    Parameters
+    ----------
+    system : :class:`systems.*`
+        Instance of the batched system, whose ``get_A`` and ``get_D`` methods return stacked matrices of shape ``(*shape, 2n, 2n)`` for a given time.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ============    ========================================================
+        key             meaning
+        ============    ========================================================
+        indices         (*list* or *tuple*) indices of the correlations to extract. Default is :math:`[(0, 0)]`.
+        t_min           (*float*) minimum time. Default is :math:`0.0`.
+        t_max           (*float*) maximum time. Default is :math:`1000.0`.
+        t_dim           (*int*) number of times from ``t_min`` to ``t_max``. Default is :math:`10001`.
+        t_index_min     (*int*) index of the first time to store. Default is :math:`0`.
+        t_index_max     (*int*) index after the last time to store. Default is ``t_dim``.
+        t_sub_dim       (*int*) number of Runge-Kutta steps between consecutive times. Default is :math:`10`.
+        ============    ========================================================
+    """
+
+    # default solver parameters
+    solver_defaults = {
+        'indices'       : [(0, 0)],
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_index_min'   : 0,
+        't_index_max'   : None,
+        't_sub_dim'     : 10
+    }
+
+    def __init__(self, system, params={}):
+        """Class constructor for BatchHLESolver."""
+
+        # set attributes
+        self.system = system
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+        if self.params['t_index_max'] is None:
+            self.params['t_index_max'] = self.params['t_dim']
+
+        # validate parameters
+        assert 0 <= self.params['t_index_min'] < self.params['t_index_max'] <= self.params['t_dim'], 'Parameters "t_index_min" and "t_index_max" should satisfy 0 <= t_index_min < t_index_max <= t_dim'
+        assert self.params['t_sub_dim'] >= 1, 'Parameter "t_sub_dim" should be a positive integer'
+
+        # times
+        self.T = np.linspace(self.params['t_min'], self.params['t_max'], self.params['t_dim'])
+
+        # initialize variables
+        self.corrs = None
+
+    def get_times(self):
+        """Method to obtain the stored times.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times from ``t_index_min`` to ``t_index_max``.
+        """
+
+        return self.T[self.params['t_index_min']:self.params['t_index_max']]
+
+    def get_rates(self, corrs, t):
+        """Method to obtain the rates of the stacked correlations.
+
+        Parameters
+        ----------
+        corrs : numpy.ndarray
+            Stacked correlations with shape ``(N, 2n, 2n)``.
+        t : float
+            Time at which the rates are calculated.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of the stacked correlations with shape ``(N, 2n, 2n)``.
+        """
+
+        # time-dependent matrices
+        if not self.system.is_A_constant:
+            self.A = np.reshape(self.system.get_A(
+                t=t
+            ), corrs.shape)
+            self.D = np.reshape(self.system.get_D(
+                t=t
+            ), corrs.shape)
+
+        AV = np.matmul(self.A, corrs)
+
+        return AV + np.swapaxes(AV, -1, -2) + self.D
+
+    def get_corrs(self):
+        """Method to obtain the stacked quadrature correlations.
+
+        Returns
+        -------
+        corrs : numpy.ndarray
+            Quadrature correlations with shape ``(*shape, t_index_max - t_index_min, 2n, 2n)``.
+        """
+
+        # solve once
+        if self.corrs is not None:
+            return self.corrs
+
+        # extract frequently used variables
+        t_index_min = self.params['t_index_min']
+        t_index_max = self.params['t_index_max']
+        t_sub_dim = self.params['t_sub_dim']
+        _, iv_corrs, _ = self.system.get_ivc()
+        shape = iv_corrs.shape[:-2]
+        dim = iv_corrs.shape[-2:]
+
+        # stacked initial values
+        V = np.reshape(iv_corrs, (-1, ) + dim).astype(np.float_)
+        corrs = np.empty((t_index_max - t_index_min, ) + V.shape, dtype=np.float_)
+
+        # constant matrices
+        if self.system.is_A_constant:
+            self.A = np.reshape(np.broadcast_to(self.system.get_A(
+                t=self.T[0]
+            ), shape + dim), V.shape)
+            self.D = np.reshape(np.broadcast_to(self.system.get_D(
+                t=self.T[0]
+            ), shape + dim), V.shape)
+
+        # integrate
+        if t_index_min == 0:
+            corrs[0] = V
+        for i in range(1, t_index_max):
+            t = self.T[i - 1]
+            h = (self.T[i] - t) / t_sub_dim
+            for _ in range(t_sub_dim):
+                k_1 = self.get_rates(V, t)
+                k_2 = self.get_rates(V + h / 2.0 * k_1, t + h / 2.0)
+                k_3 = self.get_rates(V + h / 2.0 * k_2, t + h / 2.0)
+                k_4 = self.get_rates(V + h * k_3, t + h)
+                V = V + h / 6.0 * (k_1 + 2.0 * k_2 + 2.0 * k_3 + k_4)
+                t += h
+            if i >= t_index_min:
+                corrs[i - t_index_min] = V
+
+        # move batch axes to the front
+        self.corrs = np.reshape(np.moveaxis(corrs, 0, 1), shape + (t_index_max - t_index_min, ) + dim)
+
+        return self.corrs
+
+    def get_corr_indices(self):
+        """Method to obtain the stacked correlations at the given indices.
+
+        Returns
+        -------
+        corr_indices : numpy.ndarray
+            Correlations with shape ``(*shape, t_index_max - t_index_min, len(indices))``.
+        """
+
+        # extract frequently used variables
+        indices = self.params['indices']
+        corrs = self.get_corrs()
+
+        # single index
+        if type(indices) is tuple:
+            indices = [indices]
+
+        return np.stack([corrs[..., idx[0], idx[1]] for idx in indices], axis=-1)
+
+class OnlineReducer():
+    """Class to reduce a stream of scalar values without storing them.
+
+    Parameters
+    ----------
+    mode : str
+        Reduction of the values. Available options are ``'min'``, ``'max'``, ``'mean'``, ``'argmin'`` and ``'argmax'``, where the latter two give the times of the extrema.
+    """
+
+    # available reductions
+    modes = ['min', 'max', 'mean', 'argmin', 'argmax']
+
+    def __init__(self, mode):
+        """Class constructor for OnlineReducer."""
+
+        # validate parameters
+        assert mode in self.modes, 'Parameter "mode" should be one of {}'.format(self.modes)
+
+        # set attributes
+        self.mode = mode
+
+        # initialize variables
+        self.count = 0
+        self.value = np.nan
+        self.t = np.nan
+
+    def update(self, value, t):
+        """Method to update the reduction with a new value.
+
+        Parameters
+        ----------
+        value : float
+            New value.
+        t : float
+            Time of the new value.
+        """
+
+        # running sum
+        if self.mode == 'mean':
+            self.value = value if self.count == 0 else self.value + value
+        # running extrema
+        elif self.count == 0 or (value < self.value if self.mode in ['min', 'argmin'] else value > self.value):
+            self.value = value
+            self.t = t
+        self.count += 1
+
+    def get_value(self):
+        """Method to obtain the reduced value.
+
+        Returns
+        -------
+        value : float
+            Reduced value. ``numpy.nan`` if no values were updated.
+        """
+
+        if self.mode == 'mean':
+            return self.value / self.count if self.count > 0 else np.nan
+
+        return self.t if self.mode in ['argmin', 'argmax'] else self.value
+
+class CorrelationSolver():
+    r"""Class to integrate the quadrature correlations of a system with stationary classical modes.
+
+    The correlations follow :math:`\dot{V} = A V + V A^{T} + D` on a uniform grid of times. As :math:`V` is symmetric, only its :math:`n (2n + 1)` upper-triangular entries are integrated and stored, and the full matrices are unpacked on request. The transient before ``t_index_min`` is integrated without being stored, as the correlations are written to ring buffers spanning only the window. For time-dependent systems, the rates are obtained from the ``get_corr_rates`` method of the system if it is defined. Optionally, the integration stops early once the correlations at the given indices repeat themselves over consecutive periods within a tolerance, in which case the stored window ends at the time of convergence instead of at ``t_index_max``.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.*`
+        Instance of the system.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ============    ========================================================
+        key             meaning
+        ============    ========================================================
+        indices         (*list* or *tuple*) indices of the correlations to extract and monitor. Default is :math:`[(0, 0)]`.
+        ode_method      (*str*) integrator of ``scipy.integrate.ode``, or ``'expm'`` to propagate exactly using matrix exponentials for systems with constant drift and noise matrices. Default is ``'vode'``.
+        ode_atol        (*float*) absolute tolerance of the integrator. Default is :math:`10^{-12}`.
+        ode_rtol        (*float*) relative tolerance of the integrator. Default is :math:`10^{-6}`.
+        t_min           (*float*) minimum time. Default is :math:`0.0`.
+        t_max           (*float*) maximum time. Default is :math:`1000.0`.
+        t_dim           (*int*) number of times from ``t_min`` to ``t_max``. Default is :math:`10001`.
+        t_index_min     (*int*) index of the first time to store. Default is :math:`0`.
+        t_index_max     (*int*) index after the last time to store. Default is ``t_dim``.
+        ss_tol          (*float*) relative tolerance of the change in the monitored correlations over consecutive periods to stop the integration. Default is ``None`` (disabled).
+        ss_period       (*float*) period over which the change is monitored, e.g., the modulation period. Default is :math:`\pi`.
+        store_corrs     (*bool*) option to store all the correlations in the window. If ``False``, only the correlations at the given indices are stored, or none of them if ``reduce`` is given and ``ss_tol`` is ``None``. Default is ``True``.
+        reduce          (*dict*) reductions over the window obtained during the integration, keyed by the indices of the correlations, e.g., ``'(2, 2)'``, or the codes of the measures, e.g., ``'entan_ln'``, with values ``'min'``, ``'max'``, ``'mean'``, ``'argmin'`` or ``'argmax'``. Default is ``None``.
+        ============    ========================================================
+    """
+
+    # default solver parameters
+    solver_defaults = {
+        'indices'       : [(0, 0)],
+        'ode_method'    : 'vode',
+        'ode_atol'      : 1e-12,
+        'ode_rtol'      : 1e-6,
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_index_min'   : 0,
+        't_index_max'   : None,
+        'ss_tol'        : None,
+        'ss_period'     : np.pi,
+        'store_corrs'   : True,
+        'reduce'        : None
+    }
+
+    # functions of the measures from the correlations
+    measure_funcs = {
+        'entan_ln'  : get_log_negativity
+    }
+
+    def __init__(self, system, params={}):
+        """Class constructor for CorrelationSolver."""
+
+        # set attributes
+        self.system = system
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+        if self.params['t_index_max'] is None:
+            self.params['t_index_max'] = self.params['t_dim']
+        if type(self.params['indices']) is tuple:
+            self.params['indices'] = [self.params['indices']]
+
+        # validate parameters
+        assert 0 <= self.params['t_index_min'] < self.params['t_index_max'] <= self.params['t_dim'], 'Parameters "t_index_min" and "t_index_max" should satisfy 0 <= t_index_min < t_index_max <= t_dim'
+        assert self.params['ss_tol'] is None or self.params['ss_tol'] > 0.0, 'Parameter "ss_tol" should be positive'
+
+        # times
+        self.T = np.linspace(self.params['t_min'], self.params['t_max'], self.params['t_dim'])
+
+        # initial values
+        self.iv_modes, self.iv_corrs, self.c = self.system.get_ivc()
+        self.dim = self.iv_corrs.shape
+
+        # packed entries and the packed positions of the indices
+        self.idxs_pack, self.idxs_unpack = get_packed_indices(self.dim[0])
+        self.idxs_indices = self.idxs_unpack[[idx[0] * self.dim[0] + idx[1] for idx in self.params['indices']]]
+
+        # reductions and the functions of the values to reduce
+        self.reducers = dict()
+        self.funcs_reduce = list()
+        for key, mode in (self.params['reduce'] or dict()).items():
+            self.reducers[key] = OnlineReducer(
+                mode=mode
+            )
+            self.funcs_reduce.append(self.get_func_reduce(key))
+
+        # initialize variables
+        self.A = None
+        self.D = None
+        self.t_index_min = self.params['t_index_min']
+        self.t_index_max = self.params['t_index_max']
+        self.t_ss = None
+        self.is_integrated = False
+        self.corrs_packed = None
+        self.corr_indices = None
+
+    def get_func_reduce(self, key):
+        """Method to obtain the function of the value to reduce from the packed correlations.
+
+        Parameters
+        ----------
+        key : str or tuple
+            Indices of the correlations, e.g., ``'(2, 2)'``, or the code of the measure, e.g., ``'entan_ln'``.
+
+        Returns
+        -------
+        func : callable
+            Function returning the value, formatted as ``func(corrs)``, where ``corrs`` are the packed correlations.
+        """
+
+        # measures
+        if key in self.measure_funcs:
+            func = self.measure_funcs[key]
+            return lambda corrs: func(np.reshape(corrs[self.idxs_unpack], self.dim))
+
+        # correlations
+        idx = ast.literal_eval(key) if type(key) is str else key
+        assert type(idx) is tuple and len(idx) == 2, 'Keys of parameter "reduce" should be indices of the correlations or codes of the measures in {}'.format(list(self.measure_funcs))
+        pos = self.idxs_unpack[idx[0] * self.dim[0] + idx[1]]
+
+        return lambda corrs: corrs[pos]
+
+    def get_rates(self, t, corrs):
+        """Method to obtain the rates of the packed correlations.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the rates are calculated.
+        corrs : numpy.ndarray
+            Packed correlations.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Packed rates of the correlations.
+        """
+
+        # flattened correlations
+        corrs = corrs[self.idxs_unpack]
+
+        # fused rates of time-dependent systems
+        if not self.system.is_A_constant and hasattr(self.system, 'get_corr_rates'):
+            return self.system.get_corr_rates(
+                modes=self.iv_modes,
+                corrs=corrs,
+                c=self.c,
+                t=t
+            )[self.idxs_pack]
+
+        # update matrices
+        if self.A is None or not self.system.is_A_constant:
+            self.A = self.system.get_A(
+                modes=self.iv_modes,
+                c=self.c,
+                t=t
+            )
+            self.D = self.system.get_D(
+                modes=self.iv_modes,
+                corrs=self.iv_corrs,
+                c=self.c,
+                t=t
+            )
+
+        AV = self.A.dot(np.reshape(corrs, self.dim))
+
+        return (AV + np.transpose(AV) + self.D).ravel()[self.idxs_pack]
+
+    def get_propagators(self):
+        r"""Method to obtain the exact propagators of the correlations over a time step for constant drift and noise matrices.
+
+        Following Van Loan's method, the exponential of :math:`\begin{bmatrix} - A & D \\ 0 & A^{T} \end{bmatrix} dt` contains :math:`e^{A^{T} dt}` as its lower-right block and :math:`e^{- A dt} \Sigma_{dt}` as its upper-right block, so that :math:`V(t + dt) = e^{A dt} V(t) e^{A^{T} dt} + \Sigma_{dt}`.
+
+        Returns
+        -------
+        Phi : numpy.ndarray
+            Propagator :math:`e^{A dt}`.
+        Sigma : numpy.ndarray
+            Noise accumulated over a time step.
+        """
+
+        # validate system
+        assert self.system.is_A_constant, 'System should have a constant drift matrix for the "expm" method'
+
+        # constant matrices
+        self.get_rates(self.T[0], np.ravel(self.iv_corrs)[self.idxs_pack])
+        dim = self.dim[0]
+        dt = self.T[1] - self.T[0]
+
+        # block matrix exponential
+        M = np.zeros((2 * dim, 2 * dim), dtype=np.float_)
+        M[:dim, :dim] = - self.A
+        M[:dim, dim:] = self.D
+        M[dim:, dim:] = np.transpose(self.A)
+        F = sl.expm(M * dt)
+        Phi = np.transpose(F[dim:, dim:])
+        Sigma = Phi.dot(F[:dim, dim:])
+
+        return Phi, (Sigma + np.transpose(Sigma)) / 2.0
+
+    def get_stepper(self):
+        """Method to obtain the function advancing the correlations to the next time.
+
+        Returns
+        -------
+        step : callable
+            Function returning the packed correlations at the next time, formatted as ``step(corrs, t)``, where ``corrs`` are the packed correlations at the previous time.
+        """
+
+        # exact propagation for constant matrices
+        if self.params['ode_method'] == 'expm':
+            Phi, Sigma = self.get_propagators()
+            # Phi V Phi^T acting on the packed correlations
+            P = np.kron(Phi, Phi)[self.idxs_pack].dot(np.eye(len(self.idxs_pack))[self.idxs_unpack])
+            Sigma = Sigma.ravel()[self.idxs_pack]
+            return lambda corrs, t: P.dot(corrs) + Sigma
+
+        # initialize integrator
+        integrator = si.ode(self.get_rates)
+        integrator.set_integrator(self.params['ode_method'], atol=self.params['ode_atol'], rtol=self.params['ode_rtol'], nsteps=int(1e6))
+        integrator.set_initial_value(np.array(self.iv_corrs, dtype=np.float_).ravel()[self.idxs_pack], self.T[0])
+
+        def step(corrs, t):
+            corrs = integrator.integrate(t)
+            assert integrator.successful(), 'Integration failed at time {}'.format(t)
+            return corrs
+
+        return step
+
+    def get_t_dim_ss(self):
+        """Method to obtain the number of times in a monitored period.
+
+        Returns
+        -------
+        t_dim_ss : int
+            Number of times in a period, rounded up. ``0`` if the monitoring is disabled.
+        """
+
+        if self.params['ss_tol'] is None:
+            return 0
+
+        return int(np.ceil(self.params['ss_period'] / (self.T[1] - self.T[0])))
+
+    def is_steady(self, values, i, t_dim_ss):
+        """Method to check whether the monitored correlations have converged.
+
+        The monitored correlations over the latest period are compared with their values one period earlier, which are interpolated by a cubic spline as the period need not be a multiple of the time step.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Ring buffer of the monitored correlations spanning at least the latest ``2 * t_dim_ss + 2`` times, where the values at time index ``j`` are stored at ``j % len(values)``.
+        i : int
+            Index of the latest time.
+        t_dim_ss : int
+            Number of times in a period, rounded up.
+
+        Returns
+        -------
+        is_steady : bool
+            Option denoting whether the relative change over the latest period is within the tolerance.
+        """
+
+        # monitored values over the latest two periods
+        i_min = i - 2 * t_dim_ss - 1
+        values = values[np.arange(i_min, i + 1) % len(values)]
+        curr = values[- t_dim_ss:]
+        prev = si_interp.CubicSpline(self.T[i_min:i + 1], values, axis=0)(self.T[i - t_dim_ss + 1:i + 1] - self.params['ss_period'])
+        scale = np.max(np.abs(curr))
+
+        return bool(np.max(np.abs(curr - prev)) <= self.params['ss_tol'] * (scale if scale > 0.0 else 1.0))
+
+    def integrate(self):
+        """Method to integrate the correlations and store them in the window.
+
+        The correlations are written to ring buffers whose length is the larger of the window and the two periods required to check for the steady state, so that the memory does not grow with ``t_index_max``. The reductions are updated at each time in the window, or from a ring buffer of the values to reduce if the window ends at the steady state.
+        """
+
+        # integrate once
+        if self.is_integrated:
+            return
+
+        # extract frequently used variables
+        T = self.T
+        t_dim_window = self.params['t_index_max'] - self.params['t_index_min']
+        t_dim_ss = self.get_t_dim_ss()
+        t_dim_buffer = max(t_dim_window, 2 * t_dim_ss + 2)
+
+        # initialize stepper
+        step = self.get_stepper()
+
+        # ring buffers
+        buffer_corrs = np.empty((t_dim_buffer, len(self.idxs_pack)), dtype=np.float_) if self.params['store_corrs'] else None
+        buffer_values = np.empty((t_dim_buffer, len(self.idxs_indices)), dtype=np.float_) if self.params['store_corrs'] or len(self.reducers) == 0 or t_dim_ss > 0 else None
+        buffer_reduce = np.empty((t_dim_buffer, len(self.reducers)), dtype=np.float_) if len(self.reducers) > 0 and t_dim_ss > 0 else None
+
+        # integrate
+        corrs = np.ravel(self.iv_corrs)[self.idxs_pack].astype(np.float_)
+        for i in range(self.params['t_index_max']):
+            if i > 0:
+                corrs = step(corrs, T[i])
+            if buffer_corrs is not None:
+                buffer_corrs[i % t_dim_buffer] = corrs
+            if buffer_values is not None:
+                buffer_values[i % t_dim_buffer] = corrs[self.idxs_indices]
+
+            # update reductions
+            if buffer_reduce is not None:
+                buffer_reduce[i % t_dim_buffer] = [func(corrs) for func in self.funcs_reduce]
+            elif len(self.reducers) > 0 and i >= self.t_index_min:
+                for reducer, func in zip(self.reducers.values(), self.funcs_reduce):
+                    reducer.update(func(corrs), T[i])
+
+            # check for steady state every period
+            if t_dim_ss > 0 and i >= max(2 * t_dim_ss + 1, t_dim_window - 1) and (i + 1) % t_dim_ss == 0 and self.is_steady(buffer_values, i, t_dim_ss):
+                self.t_ss = T[i]
+                self.t_index_max = i + 1
+                self.t_index_min = i + 1 - t_dim_window
+                break
+
+        # unroll the window
+        idxs = np.arange(self.t_index_min, self.t_index_max) % t_dim_buffer
+        if buffer_corrs is not None:
+            self.corrs_packed = buffer_corrs[idxs]
+        if buffer_values is not None:
+            self.corr_indices = buffer_values[idxs]
+
+        # reductions over the window
+        if buffer_reduce is not None:
+            for j, idx in enumerate(idxs):
+                for reducer, value in zip(self.reducers.values(), buffer_reduce[idx]):
+                    reducer.update(value, T[self.t_index_min + j])
+
+        self.is_integrated = True
+
+    def get_corrs_packed(self):
+        """Method to obtain the packed quadrature correlations in the stored window.
+
+        Returns
+        -------
+        corrs_packed : numpy.ndarray
+            Upper-triangular entries of the quadrature correlations with shape ``(T, n (2n + 1))``.
+        """
+
+        # validate parameters
+        assert self.params['store_corrs'], 'Parameter "store_corrs" should be True to obtain all the correlations'
+
+        self.integrate()
+
+        return self.corrs_packed
+
+    def get_corrs(self):
+        """Method to obtain the quadrature correlations in the stored window.
+
+        Returns
+        -------
+        corrs : numpy.ndarray
+            Quadrature correlations with shape ``(T, 2n, 2n)``, unpacked from the stored entries on each call.
+        """
+
+        return get_unpacked_corrs(self.get_corrs_packed())
+
+    def get_modes_corrs(self):
+        """Method to obtain the classical modes and the quadrature correlations in the stored window.
+
+        Returns
+        -------
+        modes : numpy.ndarray
+            Classical modes with shape ``(T, n)``, which remain at their initial values.
+        corrs : numpy.ndarray
+            Quadrature correlations with shape ``(T, 2n, 2n)``.
+        """
+
+        corrs = self.get_corrs()
+
+        return np.repeat(np.asarray(self.iv_modes)[None, :], len(corrs), axis=0), corrs
+
+    def get_times(self):
+        """Method to obtain the times in the stored window.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times in the stored window.
+        """
+
+        self.integrate()
+
+        return self.T[self.t_index_min:self.t_index_max]
+
+    def get_corr_indices(self):
+        """Method to obtain the correlations at the given indices in the stored window.
+
+        Returns
+        -------
+        corr_indices : numpy.ndarray
+            Correlations with shape ``(T, len(indices))``.
+        """
+
+        self.integrate()
+
+        # validate storage
+        assert self.corr_indices is not None, 'Parameter "store_corrs" should be True or "reduce" should be None to obtain the correlations at the given indices'
+
+        return self.corr_indices
+
+    def get_corr_stats(self):
+        """Method to obtain the minima, means and maxima of the correlations at the given indices in the stored window.
+
+        Returns
+        -------
+        corr_stats : dict
+            Values of the statistics with shape ``(len(indices), )`` keyed by ``'min'``, ``'mean'`` and ``'max'``.
+        """
+
+        corr_indices = self.get_corr_indices()
+
+        return {
+            'min'   : np.min(corr_indices, axis=0),
+            'mean'  : np.mean(corr_indices, axis=0),
+            'max'   : np.max(corr_indices, axis=0)
+        }
+
+    def get_reduced(self):
+        """Method to obtain the reductions over the stored window.
+
+        Returns
+        -------
+        reduced : dict
+            Reduced values keyed as in the parameter ``reduce``.
+        """
+
+        self.integrate()
+
+        return {key: reducer.get_value() for key, reducer in self.reducers.items()}
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to obtain the quantum measures of linearized systems from their quadrature correlations."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import numpy as np
+
+def get_log_negativity(corrs, pos_i=0, pos_j=1):
+    r"""Function to obtain the logarithmic negativity between two modes.
+
+    The smallest symplectic eigenvalue of the partially transposed correlation matrix of the modes with blocks :math:`A`, :math:`B` and :math:`C` is :math:`\tilde{\nu}_{-} = \sqrt{(\tilde{\Delta} - \sqrt{\tilde{\Delta}^{2} - 4 \det V}) / 2}`, where :math:`\tilde{\Delta} = \det A + \det B - 2 \det C`, and the logarithmic negativity is :math:`\max [0, - \ln 2 \tilde{\nu}_{-}]`.
+
+    The determinants are obtained in closed form from the :math:`2 \times 2` minors of the first and the last two rows of the correlation matrix, so that stacked correlations, e.g., over the times and the points of a sweep, are evaluated with elementwise array operations.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray
+        Quadrature correlations with shape ``(..., 2n, 2n)``.
+    pos_i : int, optional
+        Index of the first mode. Default is :math:`0`.
+    pos_j : int, optional
+        Index of the second mode. Default is :math:`1`.
+
+    Returns
+    -------
+    entan_ln : float or numpy.ndarray
+        Logarithmic negativity with shape ``(...)``.
+    """
+
+    # correlation matrix of the two modes
+    V = np.asarray(corrs)
+    idxs = [2 * pos_i, 2 * pos_i + 1, 2 * pos_j, 2 * pos_j + 1]
+    if idxs != list(range(V.shape[-1])):
+        V = V[..., idxs, :][..., :, idxs]
+
+    # minors of the first and the last two rows for the pairs of columns (0, 1), (0, 2), (0, 3), (1, 2), (1, 3) and (2, 3)
+    pairs = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    m_0 = [V[..., 0, k] * V[..., 1, l] - V[..., 0, l] * V[..., 1, k] for k, l in pairs]
+    m_1 = [V[..., 2, k] * V[..., 3, l] - V[..., 2, l] * V[..., 3, k] for k, l in pairs]
+
+    # invariants
+    det_A = m_0[0]
+    det_B = m_1[5]
+    det_C = m_0[5]
+    det_V = m_0[0] * m_1[5] - m_0[1] * m_1[4] + m_0[2] * m_1[3] + m_0[3] * m_1[2] - m_0[4] * m_1[1] + m_0[5] * m_1[0]
+    Delta_tilde = det_A + det_B - 2.0 * det_C
+
+    # smallest symplectic eigenvalue of the partial transpose
+    nu_minus = np.sqrt(np.maximum((Delta_tilde - np.sqrt(np.maximum(Delta_tilde**2 - 4.0 * det_V, 0.0))) / 2.0, 0.0))
+
+    with np.errstate(divide='ignore'):
+        return np.maximum(0.0, - np.log(2.0 * nu_minus))[()]
+
+def get_Wigner_distributions_single_mode(corrs, xs, ys, pos=0, frames=None, dtype=np.float_):
+    r"""Function to obtain the Wigner distributions of a single mode from its quadrature correlations.
+
+    The distribution of the mode with zero mean and correlation matrix :math:`V` is the Gaussian :math:`W (x, y) = \exp (- r^{T} V^{-1} r / 2) / (2 \pi \sqrt{\det V})` with :math:`r = (x, y)^{T}`, which is evaluated over the grid by broadcasting the coefficients of the quadratic form of each frame.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray
+        Quadrature correlations with shape ``(T, 2n, 2n)``.
+    xs : numpy.ndarray
+        Values of the first quadrature.
+    ys : numpy.ndarray
+        Values of the second quadrature.
+    pos : int, optional
+        Index of the mode. Default is :math:`0`.
+    frames : list, optional
+        Indices of the frames to evaluate. Default is ``None`` (all).
+    dtype : numpy.dtype, optional
+        Type of the distributions, e.g., ``numpy.float32`` to halve the memory. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    Wigners : numpy.ndarray
+        Wigner distributions with shape ``(len(frames), len(ys), len(xs))``.
+    """
+
+    # correlation matrices of the mode in the frames
+    corrs = np.asarray(corrs)
+    if frames is not None:
+        corrs = corrs[np.asarray(frames)]
+    V = corrs[:, 2 * pos:2 * pos + 2, 2 * pos:2 * pos + 2]
+
+    # coefficients of the quadratic form of the inverse
+    det_V = V[:, 0, 0] * V[:, 1, 1] - V[:, 0, 1] * V[:, 1, 0]
+    a = (V[:, 1, 1] / det_V / 2.0).astype(dtype)[:, None, None]
+    b = (- (V[:, 0, 1] + V[:, 1, 0]) / det_V / 2.0).astype(dtype)[:, None, None]
+    c = (V[:, 0, 0] / det_V / 2.0).astype(dtype)[:, None, None]
+    norm = (1.0 / 2.0 / np.pi / np.sqrt(det_V)).astype(dtype)[:, None, None]
+
+    # grid
+    X = np.asarray(xs, dtype=dtype)[None, None, :]
+    Y = np.asarray(ys, dtype=dtype)[None, :, None]
+
+    return norm * np.exp(- (a * X**2 + b * X * Y + c * Y**2))
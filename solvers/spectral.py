@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to integrate the fluctuation spectra of linearized systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import numpy as np
+
+def get_spectral_grid(poles, dim=64):
+    r"""Function to obtain a quadrature grid over the real line refined around the poles of a spectrum.
+
+    The real line is partitioned at the midpoints between the sorted centers :math:`c_{k}` of the poles :math:`c_{k} + i w_{k}`. Within the interval around each center, the frequencies are mapped as :math:`\omega = c_{k} + |w_{k}| \tan \theta` and ``dim`` Gauss-Legendre points are placed in :math:`\theta`, so that each resonance is resolved irrespective of its width and the outermost intervals extend to infinity.
+
+    Parameters
+    ----------
+    poles : numpy.ndarray
+        Poles of the spectrum with shape ``(*shape, K)``.
+    dim : int, optional
+        Number of points per pole. Default is :math:`64`.
+
+    Returns
+    -------
+    omegas : numpy.ndarray
+        Frequencies with shape ``(*shape, K * dim)``.
+    weights : numpy.ndarray
+        Quadrature weights with shape ``(*shape, K * dim)``.
+    """
+
+    # sorted centers and widths
+    poles = np.asarray(poles, dtype=np.complex_)
+    idxs = np.argsort(np.real(poles), axis=-1)
+    centers = np.take_along_axis(np.real(poles), idxs, axis=-1)
+    widths = np.take_along_axis(np.abs(np.imag(poles)), idxs, axis=-1)
+    # poles on the real axis are assigned a small width
+    scale = np.max(np.abs(poles), axis=-1, keepdims=True)
+    widths = np.maximum(widths, np.finfo(np.float_).eps * np.where(scale == 0.0, 1.0, scale))
+
+    # mapped limits of the intervals
+    mids = (centers[..., 1:] + centers[..., :-1]) / 2.0
+    theta_mins = np.concatenate((np.full(centers.shape[:-1] + (1, ), - np.pi / 2.0), np.arctan((mids - centers[..., 1:]) / widths[..., 1:])), axis=-1)
+    theta_maxs = np.concatenate((np.arctan((mids - centers[..., :-1]) / widths[..., :-1]), np.full(centers.shape[:-1] + (1, ), np.pi / 2.0)), axis=-1)
+
+    # Gauss-Legendre points in the mapped intervals
+    xs, ws = np.polynomial.legendre.leggauss(dim)
+    half_spans = ((theta_maxs - theta_mins) / 2.0)[..., None]
+    thetas = ((theta_maxs + theta_mins) / 2.0)[..., None] + half_spans * xs
+    omegas = centers[..., None] + widths[..., None] * np.tan(thetas)
+    weights = half_spans * ws * widths[..., None] / np.cos(thetas)**2
+
+    return np.reshape(omegas, poles.shape[:-1] + (-1, )), np.reshape(weights, poles.shape[:-1] + (-1, ))
+
+def get_spectral_integral(func, poles, dim=64):
+    r"""Function to integrate a vectorized spectrum over the real line.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized spectrum, formatted as ``func(omegas)``, where ``omegas`` has shape ``(*shape, M)``.
+    poles : numpy.ndarray
+        Poles of the spectrum with shape ``(*shape, K)``. Refer to :func:`get_spectral_grid` for the grid.
+    dim : int, optional
+        Number of points per pole. Default is :math:`64`.
+
+    Returns
+    -------
+    integral : numpy.ndarray
+        Integral of the spectrum with shape ``shape``.
+    """
+
+    # frequencies and weights
+    omegas, weights = get_spectral_grid(
+        poles=poles,
+        dim=dim
+    )
+
+    return np.sum(np.real(func(omegas)) * weights, axis=-1)
+
+def get_poly_product(*polys):
+    """Function to multiply polynomials with coefficients along the trailing axis.
+
+    Parameters
+    ----------
+    *polys : numpy.ndarray
+        Coefficients in the order of increasing degree. The leading axes are broadcast.
+
+    Returns
+    -------
+    poly : numpy.ndarray
+        Coefficients of the product.
+    """
+
+    poly = np.asarray(polys[0], dtype=np.complex_)
+    for other in polys[1:]:
+        other = np.asarray(other, dtype=np.complex_)
+        shape = np.broadcast_shapes(poly.shape[:-1], other.shape[:-1])
+        product = np.zeros(shape + (poly.shape[-1] + other.shape[-1] - 1, ), dtype=np.complex_)
+        for i in range(other.shape[-1]):
+            product[..., i:i + poly.shape[-1]] += poly * other[..., i:i + 1]
+        poly = product
+
+    return poly
+
+def get_poly_sum(*polys):
+    """Function to add polynomials with coefficients along the trailing axis.
+
+    Parameters
+    ----------
+    *polys : numpy.ndarray
+        Coefficients in the order of increasing degree. The leading axes are broadcast.
+
+    Returns
+    -------
+    poly : numpy.ndarray
+        Coefficients of the sum.
+    """
+
+    # pad to the highest degree
+    dim = max([np.shape(poly)[-1] for poly in polys])
+    polys = [np.asarray(poly, dtype=np.complex_) for poly in polys]
+
+    return sum([np.concatenate((poly, np.zeros(poly.shape[:-1] + (dim - poly.shape[-1], ), dtype=np.complex_)), axis=-1) for poly in polys])
+
+def get_poly_values(poly, xs):
+    """Function to evaluate polynomials with coefficients along the trailing axis using Horner's method.
+
+    Parameters
+    ----------
+    poly : numpy.ndarray
+        Coefficients with shape ``(*shape, deg + 1)`` in the order of increasing degree.
+    xs : numpy.ndarray
+        Points with shape ``(*shape, M)``.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Values with shape ``(*shape, M)``.
+    """
+
+    values = np.zeros(np.broadcast_shapes(poly.shape[:-1] + (1, ), np.shape(xs)), dtype=np.complex_)
+    for i in range(poly.shape[-1] - 1, -1, -1):
+        values = values * xs + poly[..., i:i + 1]
+
+    return values
+
+def get_poly_roots(poly):
+    """Function to obtain the roots of polynomials with coefficients along the trailing axis.
+
+    The roots are the eigenvalues of the stacked companion matrices.
+
+    Parameters
+    ----------
+    poly : numpy.ndarray
+        Coefficients with shape ``(*shape, deg + 1)`` in the order of increasing degree and non-zero leading coefficients.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        Roots with shape ``(*shape, deg)``.
+    """
+
+    # validate leading coefficients
+    assert np.all(poly[..., -1] != 0.0), 'Leading coefficients of the polynomials should be non-zero'
+
+    # companion matrices
+    deg = poly.shape[-1] - 1
+    companions = np.zeros(poly.shape[:-1] + (deg, deg), dtype=np.complex_)
+    companions[..., np.arange(1, deg), np.arange(deg - 1)] = 1.0
+    companions[..., :, -1] = - poly[..., :-1] / poly[..., -1:]
+
+    return np.linalg.eigvals(companions)
+
+def get_rational_spectral_integral(num, den):
+    r"""Function to integrate a rational spectrum of the form :math:`N(\omega) / D(\omega) / D(- \omega)` over the real line.
+
+    The poles are the roots :math:`z_{j}` of :math:`D(\omega)` and :math:`- z_{j}` of :math:`D(- \omega)`, and the integral is :math:`2 \pi i` times the sum of the residues at the poles in the upper half-plane. The poles are assumed to be simple and away from the real axis, and the degree of :math:`N` should be less than that of :math:`D(\omega) D(- \omega)` by at least two.
+
+    Parameters
+    ----------
+    num : numpy.ndarray
+        Coefficients of the numerator with shape ``(*shape, deg_num + 1)`` in the order of increasing degree.
+    den : numpy.ndarray
+        Coefficients of the factor of the denominator with shape ``(*shape, deg_den + 1)`` in the order of increasing degree.
+
+    Returns
+    -------
+    integral : numpy.ndarray
+        Integral of the spectrum with shape ``shape``.
+    """
+
+    # frequently used variables
+    num = np.asarray(num, dtype=np.complex_)
+    den = np.asarray(den, dtype=np.complex_)
+    shape = np.broadcast_shapes(num.shape[:-1], den.shape[:-1])
+    num = np.broadcast_to(num, shape + num.shape[-1:])
+    den = np.broadcast_to(den, shape + den.shape[-1:])
+    assert num.shape[-1] - 1 <= 2 * (den.shape[-1] - 1) - 2, 'Degree of the numerator should be less than that of the denominator by at least two'
+
+    # roots of the factor and its derivative
+    zs = get_poly_roots(den)
+    den_prime = den[..., 1:] * np.arange(1, den.shape[-1])
+    den_prime_zs = get_poly_values(den_prime, zs)
+
+    # residues at z of N(w) / D(w) / D(- w)
+    res_p = get_poly_values(num, zs) / den_prime_zs / get_poly_values(den, - zs)
+    # residues at - z, where d D(- w) / dw = - D'(z)
+    res_m = get_poly_values(num, - zs) / get_poly_values(den, - zs) / (- den_prime_zs)
+
+    # sum over the poles in the upper half-plane
+    residues = np.where(np.imag(zs) > 0.0, res_p, 0.0) + np.where(np.imag(- zs) > 0.0, res_m, 0.0)
+
+    return np.real(2.0j * np.pi * np.sum(residues, axis=-1))
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to obtain the stationary correlations of linearized systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import logging
+import numpy as np
+import scipy.integrate as si
+import scipy.linalg as sl
+
+# local modules
+from solvers.measure import get_log_negativity
+
+# module logger
+logger = logging.getLogger(__name__)
+
+def solve_lyapunov(A, D):
+    r"""Function to solve the continuous Lyapunov equation :math:`A V + V A^{T} + D = 0`.
+
+    Stacked matrices are solved together as the linear systems :math:`( A \otimes I + I \otimes A ) \mathrm{vec} ( V ) = - \mathrm{vec} ( D )`, which are small for the few modes of linearized systems.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        Drift matrix, or stacked drift matrices with shape ``(*shape, 2n, 2n)``.
+    D : numpy.ndarray
+        Noise matrix, or stacked noise matrices with shape ``(*shape, 2n, 2n)``.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Stationary quadrature correlations with the shape of the drift matrices.
+    """
+
+    # single matrix
+    if np.ndim(A) == 2:
+        V = sl.solve_continuous_lyapunov(A, - D)
+    # stacked matrices
+    else:
+        dim = A.shape[-1]
+        I = np.eye(dim, dtype=np.float_)
+        L = np.einsum('...ij,kl->...ikjl', A, I) + np.einsum('ij,...kl->...ikjl', I, A)
+        V = np.linalg.solve(np.reshape(L, A.shape[:-2] + (dim**2, dim**2)), - np.reshape(np.broadcast_to(D, A.shape), A.shape[:-2] + (dim**2, 1)))
+        V = np.reshape(V, A.shape)
+
+    # symmetrize round-off errors
+    return (V + np.swapaxes(V, -1, -2)) / 2.0
+
+class LyapunovSolver():
+    r"""Class to obtain the steady-state quadrature correlations of a system with constant drift and noise matrices.
+
+    The correlations are obtained by solving :math:`A V + V A^{T} + D = 0` directly instead of integrating the Heisenberg-Langevin equations until the transients decay. The quantum measures of the steady state are obtained from these correlations as well. For batched systems such as :class:`systems.MiddleMembrane.MM_01_Batch`, whose matrices are stacked along the leading axes, all the points are solved together and the results are stacked along the same axes.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.*`
+        Instance of the system with ``is_A_constant`` set to ``True``.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ============    ========================================================
+        key             meaning
+        ============    ========================================================
+        indices         (*list* or *tuple*) indices of the correlations to extract. Default is :math:`[(0, 0)]`.
+        measure_codes   (*list*) codes of the measures to obtain, e.g., ``'entan_ln'`` for the logarithmic negativity between the first two modes. Default is ``[]``.
+        t               (*float*) time at which the drift and noise matrices are evaluated. Default is :math:`0.0`.
+        ============    ========================================================
+    """
+
+    # default solver parameters
+    solver_defaults = {
+        'indices'       : [(0, 0)],
+        'measure_codes' : [],
+        't'             : 0.0
+    }
+
+    # functions of the measures from the correlations
+    measure_funcs = {
+        'entan_ln'  : get_log_negativity
+    }
+
+    def __init__(self, system, params={}):
+        """Class constructor for LyapunovSolver."""
+
+        # validate system
+        assert system.is_A_constant, 'System should have a constant drift matrix'
+
+        # set attributes
+        self.system = system
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+
+        # validate parameters
+        assert all([code in self.measure_funcs for code in self.params['measure_codes']]), 'Parameter "measure_codes" should contain the codes in {}'.format(list(self.measure_funcs))
+
+        # initialize variables
+        self.A = None
+        self.D = None
+        self.eigs = None
+        self.is_stable = None
+        self.corrs = None
+
+    def get_stability(self):
+        """Method to check whether the drift matrix is Hurwitz.
+
+        Returns
+        -------
+        is_stable : bool or numpy.ndarray
+            Option denoting whether all eigenvalues of the drift matrix have negative real parts, for each point of a batched system.
+        eigs : numpy.ndarray
+            Eigenvalues of the drift matrix.
+        """
+
+        # evaluate once
+        if self.is_stable is None:
+            # extract frequently used variables
+            t = self.params['t']
+            iv_modes, iv_corrs, c = self.system.get_ivc()
+
+            # matrices are reused by the system, hence copied
+            self.A = np.array(self.system.get_A(
+                modes=iv_modes,
+                c=c,
+                t=t
+            ), dtype=np.float_)
+            self.D = np.array(self.system.get_D(
+                modes=iv_modes,
+                corrs=iv_corrs,
+                c=c,
+                t=t
+            ), dtype=np.float_)
+
+            # eigenvalues of the drift matrix
+            self.eigs = np.linalg.eigvals(self.A)
+            self.is_stable = np.max(np.real(self.eigs), axis=-1) < 0.0
+
+            # stability diagnostic
+            if self.is_stable.ndim == 0:
+                self.is_stable = bool(self.is_stable)
+                if not self.is_stable:
+                    logger.warning('Drift matrix of {} is not Hurwitz (maximum real part of eigenvalues is {:0.4e}); the steady state does not exist\n'.format(self.system.name, np.max(np.real(self.eigs))))
+            elif not np.all(self.is_stable):
+                logger.warning('Drift matrices of {} of {} points of {} are not Hurwitz; their steady states do not exist\n'.format(np.count_nonzero(~ self.is_stable), self.is_stable.size, self.system.name))
+
+        return self.is_stable, self.eigs
+
+    def get_corrs(self):
+        """Method to obtain the steady-state quadrature correlations.
+
+        Returns
+        -------
+        corrs : numpy.ndarray
+            Steady-state quadrature correlations. The values are ``numpy.nan`` if the system is unstable.
+        """
+
+        # solve once
+        if self.corrs is None:
+            is_stable, _ = self.get_stability()
+            # single system
+            if np.ndim(is_stable) == 0:
+                if is_stable:
+                    self.corrs = solve_lyapunov(
+                        A=self.A,
+                        D=self.D
+                    )
+                else:
+                    self.corrs = np.full(self.A.shape, np.nan, dtype=np.float_)
+            # batched systems, with the unstable points replaced by a solvable placeholder
+            else:
+                A = np.where(is_stable[..., None, None], self.A, - np.eye(self.A.shape[-1]))
+                self.corrs = solve_lyapunov(
+                    A=A,
+                    D=np.broadcast_to(self.D, A.shape)
+                )
+                self.corrs[~ is_stable] = np.nan
+
+        return self.corrs
+
+    def get_corr_indices(self):
+        """Method to obtain the steady-state correlations at the given indices.
+
+        Returns
+        -------
+        corr_indices : numpy.ndarray
+            Steady-state correlations in the order of the indices along the last axis.
+        """
+
+        # extract frequently used variables
+        indices = self.params['indices']
+        corrs = self.get_corrs()
+
+        # single index
+        if type(indices) is tuple:
+            indices = [indices]
+
+        return np.moveaxis(np.array([corrs[..., idx[0], idx[1]] for idx in indices], dtype=np.float_), 0, -1)
+
+    def get_measures(self):
+        """Method to obtain the steady-state measures.
+
+        Returns
+        -------
+        measures : numpy.ndarray
+            Steady-state measures in the order of the codes along the last axis. The values are ``numpy.nan`` if the system is unstable.
+        """
+
+        # extract frequently used variables
+        corrs = self.get_corrs()
+
+        return np.moveaxis(np.array([self.measure_funcs[code](corrs) for code in self.params['measure_codes']], dtype=np.float_), 0, -1)
+
+class FloquetSolver():
+    r"""Class to obtain the periodic steady-state quadrature correlations of a system with a periodic drift matrix.
+
+    The monodromy matrix :math:`M = \Phi(T)` and the noise accumulated over one period :math:`Q` are obtained by integrating a single period, following which the initial correlations of the limit cycle are the solution of the discrete Lyapunov equation :math:`V_{0} = M V_{0} M^{T} + Q`. The limit cycle is then integrated over one more period.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.*`
+        Instance of the system with stationary classical modes.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ============    ========================================================
+        key             meaning
+        ============    ========================================================
+        indices         (*list* or *tuple*) indices of the correlations to extract. Default is :math:`[(0, 0)]`.
+        period          (*float*) common period of the drift and noise matrices. Default is :math:`\pi`.
+        period_dim      (*int*) number of points in the limit cycle, including both ends of the period. Default is :math:`101`.
+        ode_method      (*str*) method used by ``scipy.integrate.solve_ivp``. Default is ``'DOP853'``.
+        rtol            (*float*) relative tolerance of the integration. Default is :math:`10^{-10}`.
+        atol            (*float*) absolute tolerance of the integration. Default is :math:`10^{-12}`.
+        ============    ========================================================
+    """
+
+    # default solver parameters
+    solver_defaults = {
+        'indices'       : [(0, 0)],
+        'period'        : np.pi,
+        'period_dim'    : 101,
+        'ode_method'    : 'DOP853',
+        'rtol'          : 1e-10,
+        'atol'          : 1e-12
+    }
+
+    def __init__(self, system, params={}):
+        """Class constructor for FloquetSolver."""
+
+        # set attributes
+        self.system = system
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+
+        # validate parameters
+        assert self.params['period'] > 0.0, 'Parameter "period" should be positive'
+        assert self.params['period_dim'] > 1, 'Parameter "period_dim" should be greater than 1'
+
+        # initialize variables
+        self.iv_modes, self.iv_corrs, self.c = self.system.get_ivc()
+        self.dim = self.iv_corrs.shape[0]
+        self.T = np.linspace(0.0, self.params['period'], self.params['period_dim'])
+        self.multipliers = None
+        self.is_stable = None
+        self.corrs = None
+
+    def _integrate(self, func, y_0, t_eval=None):
+        """Method to integrate a function over one period.
+
+        Parameters
+        ----------
+        func : callable
+            Function returning the rates, formatted as ``func(t, y)``.
+        y_0 : numpy.ndarray
+            Initial values.
+        t_eval : numpy.ndarray, optional
+            Times at which the values are stored.
+
+        Returns
+        -------
+        ys : numpy.ndarray
+            Values at the final time if ``t_eval`` is ``None``, else at each time of ``t_eval``.
+        """
+
+        sol = si.solve_ivp(
+            fun=func,
+            t_span=(0.0, self.params['period']),
+            y0=y_0,
+            method=self.params['ode_method'],
+            t_eval=t_eval,
+            rtol=self.params['rtol'],
+            atol=self.params['atol']
+        )
+        assert sol.success, 'Integration failed: {}'.format(sol.message)
+
+        return sol.y[:, -1] if t_eval is None else np.transpose(sol.y)
+
+    def get_stability(self):
+        """Method to check whether the periodic steady state is stable.
+
+        Returns
+        -------
+        is_stable : bool
+            Option denoting whether all Floquet multipliers lie inside the unit circle.
+        multipliers : numpy.ndarray
+            Floquet multipliers, i.e., the eigenvalues of the monodromy matrix.
+        """
+
+        # evaluate once
+        if self.is_stable is None:
+            # extract frequently used variables
+            iv_modes, iv_corrs, c = self.iv_modes, self.iv_corrs, self.c
+            dim = self.dim
+
+            # monodromy matrix and noise accumulated over one period from zero correlations
+            def func_monodromy(t, y):
+                A = self.system.get_A(
+                    modes=iv_modes,
+                    c=c,
+                    t=t
+                )
+                D = self.system.get_D(
+                    modes=iv_modes,
+                    corrs=iv_corrs,
+                    c=c,
+                    t=t
+                )
+                Phi = np.reshape(y[:dim**2], (dim, dim))
+                V = np.reshape(y[dim**2:], (dim, dim))
+                AV = A.dot(V)
+                return np.concatenate((A.dot(Phi).ravel(), (AV + np.transpose(AV) + D).ravel()))
+
+            y_T = self._integrate(
+                func=func_monodromy,
+                y_0=np.concatenate((np.eye(dim).ravel(), np.zeros(dim**2)))
+            )
+            self.M = np.reshape(y_T[:dim**2], (dim, dim))
+            self.Q = np.reshape(y_T[dim**2:], (dim, dim))
+
+            # Floquet multipliers
+            self.multipliers = np.linalg.eigvals(self.M)
+            self.is_stable = bool(np.max(np.abs(self.multipliers)) < 1.0)
+
+            # stability diagnostic
+            if not self.is_stable:
+                logger.warning('Monodromy matrix of {} has a Floquet multiplier of magnitude {:0.4e}; the periodic steady state does not exist\n'.format(self.system.name, np.max(np.abs(self.multipliers))))
+
+        return self.is_stable, self.multipliers
+
+    def get_times(self):
+        """Method to obtain the times of the limit cycle.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times over one period.
+        """
+
+        return self.T
+
+    def get_corrs(self):
+        """Method to obtain the quadrature correlations over the limit cycle.
+
+        Returns
+        -------
+        corrs : numpy.ndarray
+            Quadrature correlations at each time of the limit cycle. The values are ``numpy.nan`` if the system is unstable.
+        """
+
+        # solve once
+        if self.corrs is None:
+            is_stable, _ = self.get_stability()
+            iv_modes, iv_corrs, c = self.iv_modes, self.iv_corrs, self.c
+            dim = self.dim
+            if not is_stable:
+                self.corrs = np.full((len(self.T), dim, dim), np.nan, dtype=np.float_)
+                return self.corrs
+
+            # initial correlations of the limit cycle
+            V_0 = sl.solve_discrete_lyapunov(self.M, self.Q)
+            V_0 = (V_0 + np.transpose(V_0)) / 2.0
+
+            # correlations over the limit cycle
+            def func_corrs(t, y):
+                A = self.system.get_A(
+                    modes=iv_modes,
+                    c=c,
+                    t=t
+                )
+                D = self.system.get_D(
+                    modes=iv_modes,
+                    corrs=iv_corrs,
+                    c=c,
+                    t=t
+                )
+                AV = A.dot(np.reshape(y, (dim, dim)))
+                return (AV + np.transpose(AV) + D).ravel()
+
+            # fused rates if available
+            if hasattr(self.system, 'get_corr_rates'):
+                func_corrs = lambda t, y: self.system.get_corr_rates(
+                    modes=iv_modes,
+                    corrs=y,
+                    c=c,
+                    t=t
+                )
+
+            self.corrs = np.reshape(self._integrate(
+                func=func_corrs,
+                y_0=V_0.ravel(),
+                t_eval=self.T
+            ), (len(self.T), dim, dim))
+
+        return self.corrs
+
+    def get_corr_indices(self):
+        """Method to obtain the correlations at the given indices over the limit cycle.
+
+        Returns
+        -------
+        corr_indices : numpy.ndarray
+            Correlations at each time of the limit cycle in the order of the indices.
+        """
+
+        # extract frequently used variables
+        indices = self.params['indices']
+        corrs = self.get_corrs()
+
+        # single index
+        if type(indices) is tuple:
+            indices = [indices]
+
+        return np.transpose([corrs[:, idx[0], idx[1]] for idx in indices])
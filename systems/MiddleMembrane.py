@@ -6,15 +6,126 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2022-04-01"
-__updated__ = "2024-01-10"
+__updated__ = "2026-10-17"
 
 # dependencies
 import numpy as np
 import scipy.integrate as si
 
+# optional dependencies
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # qom modules
 from qom.systems import BaseSystem
 
+# local modules
+from solvers.spectral import get_poly_product, get_poly_sum, get_rational_spectral_integral, get_spectral_integral
+
+def get_A_wrwa(t, params):
+    """Function to obtain the drift matrix without RWA.
+
+    The sideband amplitudes are real, hence the real and imaginary parts of the modes are obtained directly from the cosine and sine of the modulation.
+
+    Parameters
+    ----------
+    t : float
+        Time at which the values are calculated.
+    params : numpy.ndarray
+        Parameters of the system in the order of :meth:`MM_01.get_params_wrwa`.
+
+    Returns
+    -------
+    A : numpy.ndarray
+        Drift matrix.
+    """
+
+    # extract frequently used variables
+    kappa_norm = params[0]
+    gamma_norm = params[1]
+    Delta_norm = params[2]
+    g_norm = params[3]
+
+    # modes
+    re_alpha = params[4] + (params[5] + params[6]) * np.cos(params[10] * t)
+    im_alpha = (params[5] - params[6]) * np.sin(params[10] * t)
+    re_beta = params[7] + (params[8] + params[9]) * np.cos(params[11] * t)
+
+    # frequently used expressions
+    G_x = 8.0 * g_norm * re_beta * re_alpha
+    G_y = 8.0 * g_norm * re_beta * im_alpha
+
+    # drift matrix
+    A = np.zeros((4, 4))
+    # X quadratures
+    A[0, 0] = - kappa_norm / 2.0
+    A[0, 1] = Delta_norm
+    A[0, 2] = - G_y
+    # Y quadratures
+    A[1, 0] = - Delta_norm
+    A[1, 1] = - kappa_norm / 2.0
+    A[1, 2] = G_x
+    # Q quadratures
+    A[2, 2] = - gamma_norm / 2.0
+    A[2, 3] = 1.0
+    # P quadratures
+    A[3, 0] = G_x
+    A[3, 1] = G_y
+    A[3, 2] = - 1.0 + 4.0 * g_norm * (re_alpha**2 + im_alpha**2)
+    A[3, 3] = - gamma_norm / 2.0
+
+    return A
+
+def _get_corr_rates_wrwa_loops(t, corrs, params):
+    """Function to obtain the rates of the flattened correlations without RWA using explicit loops, which are compiled with Numba."""
+
+    # drift matrix
+    A = get_A_wrwa(t, params)
+
+    # upper triangle of A V + (A V)^T mirrored to the lower triangle
+    rates = np.empty(16)
+    for i in range(4):
+        for j in range(i, 4):
+            rate = 0.0
+            for k in range(4):
+                rate += A[i, k] * corrs[4 * k + j] + A[j, k] * corrs[4 * k + i]
+            rates[4 * i + j] = rate
+            rates[4 * j + i] = rate
+
+    # noise matrix
+    rates[0] += params[12]
+    rates[5] += params[12]
+    rates[10] += params[13]
+    rates[15] += params[13]
+
+    return rates
+
+def _get_corr_rates_wrwa_numpy(t, corrs, params):
+    """Function to obtain the rates of the flattened correlations without RWA using NumPy products."""
+
+    # drift matrix
+    A = get_A_wrwa(t, params)
+
+    AV = A.dot(np.reshape(corrs, (4, 4)))
+    rates = AV + np.transpose(AV)
+
+    # noise matrix
+    rates[0, 0] += params[12]
+    rates[1, 1] += params[12]
+    rates[2, 2] += params[13]
+    rates[3, 3] += params[13]
+
+    return rates.ravel()
+
+# compile the kernels if Numba is available, else fall back to NumPy
+if numba is not None:
+    get_A_wrwa = numba.njit(cache=True)(get_A_wrwa)
+    get_corr_rates_wrwa = numba.njit(cache=True)(_get_corr_rates_wrwa_loops)
+else:
+    get_corr_rates_wrwa = _get_corr_rates_wrwa_numpy
+
 class MM_01(BaseSystem):
     r"""Class to simulate a membrane-in-the-middle system driven by a modulated laser using constant mode amplitudes.
 
@@ -68,6 +179,9 @@ class MM_01(BaseSystem):
         assert type(self.params['t_rwa']) is bool, 'Parameter "t_rwa" should be of type boolean'
         self.is_A_constant = self.params['t_rwa']
 
+        # initialize variables
+        self.params_wrwa = None
+
     def get_A(self, modes, c, t):
         """Method to obtain the drift matrix.
 
@@ -144,6 +258,64 @@ class MM_01(BaseSystem):
 
         return self.A
 
+    def get_corr_rates(self, modes, corrs, c, t):
+        """Method to obtain the rates of change of the flattened correlations.
+
+        Without RWA, the drift matrix and the rates are evaluated together by :func:`get_corr_rates_wrwa`, which is compiled with Numba if it is available.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        corrs : numpy.ndarray
+            Flattened quantum correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        corr_rates : numpy.ndarray
+            Flattened rates of change of the correlations.
+        """
+
+        # with RWA
+        if self.params['t_rwa']:
+            AV = self.get_A(
+                modes=modes,
+                c=c,
+                t=t
+            ).dot(np.reshape(corrs, self.dim_corrs))
+            return (AV + np.transpose(AV) + self.get_D(
+                modes=modes,
+                corrs=corrs,
+                c=c,
+                t=t
+            )).ravel()
+
+        # without RWA
+        if self.params_wrwa is None:
+            self.params_wrwa = self.get_params_wrwa()
+
+        return get_corr_rates_wrwa(t, np.asarray(corrs, dtype=np.float_).ravel(), self.params_wrwa)
+
+    def get_params_wrwa(self):
+        r"""Method to obtain the parameters of the kernels without RWA.
+
+        Returns
+        -------
+        params_wrwa : numpy.ndarray
+            Parameters in the order :math:`\kappa`, :math:`\gamma`, :math:`\Delta`, :math:`g`, :math:`\alpha_{0}`, :math:`\alpha_{-}`, :math:`\alpha_{+}`, :math:`\beta_{0}`, :math:`\beta_{-}`, :math:`\beta_{+}`, :math:`\Omega_{a}`, :math:`\Omega_{b}` (all normalized) followed by the diagonal entries :math:`\kappa (n_{a} + 1 / 2)` and :math:`\gamma (n_{b} + 1 / 2)` of the noise matrix.
+        """
+
+        # extract frequently used variables
+        gamma_norm = self.params['gamma_norm']
+        kappa_norm = self.params['kappa_norm']
+        n_a, n_b = self.params['ns']
+
+        return np.array([kappa_norm, gamma_norm, self.params['Delta_norm'], self.params['g_norm']] + list(self.params['alphas']) + list(self.params['betas']) + list(self.params['Omega_norms']) + [kappa_norm * (n_a + 0.5), gamma_norm * (n_b + 0.5)], dtype=np.float_)
+
     def get_params_ratio(self, c):
         """Method to obtain the squeezing ratio.
 
@@ -290,7 +462,7 @@ class MM_01(BaseSystem):
         
         Returns
         -------
-        var_Q_ss_rwa : float
+        var_Q_ss_rwa : float or numpy.ndarray
             Variance of the position quadrature.
         """
 
@@ -309,23 +481,22 @@ class MM_01(BaseSystem):
             c=c
         )
 
-        # substituted expressions
+        # substituted expressions as arrays, so that divisions by zero are not raised for scalars
+        G_minus_norm, G_plus_norm, G_tilde_minus_norm = np.asarray(G_minus_norm, dtype=np.float_), np.asarray(G_plus_norm, dtype=np.float_), np.asarray(G_tilde_minus_norm, dtype=np.float_)
         r = np.arctanh(ratio)
         h = 2.0 * G_plus_norm * G_minus_norm / kappa_norm + gamma_norm / 2.0
 
-        # corner cases
-        if G_minus_norm * h == 0.0:
-            _coeff = np.inf
-        else:
-            _coeff = G_tilde_minus_norm * G_plus_norm / (G_minus_norm * h)
-        if G_tilde_minus_norm**2 - h**2 == 0.0:
-            return np.inf
+        # corner cases are handled element-wise to support arrays of parameters
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _coeff = np.where(G_minus_norm * h == 0.0, np.inf, G_tilde_minus_norm * G_plus_norm / (G_minus_norm * h))
             
-        # steady-state variance
-        return h * np.exp(- 2.0 * r) / 2.0 / (G_tilde_minus_norm**2 - h**2) * (gamma_norm * (n_b + 0.5) * (_coeff * np.exp(-2.0 * r) - np.exp(2.0 * r)) - 4.0 * G_plus_norm * G_minus_norm / kappa_norm * (n_a + 0.5) * (1.0 + _coeff))
+            # steady-state variance
+            var_Q_ss_rwa = h * np.exp(- 2.0 * r) / 2.0 / (G_tilde_minus_norm**2 - h**2) * (gamma_norm * (n_b + 0.5) * (_coeff * np.exp(-2.0 * r) - np.exp(2.0 * r)) - 4.0 * G_plus_norm * G_minus_norm / kappa_norm * (n_a + 0.5) * (1.0 + _coeff))
+
+        return np.where(G_tilde_minus_norm**2 - h**2 == 0.0, np.inf, var_Q_ss_rwa)[()]
 
-    def get_var_Q_ft_rwa(self, c):
-        """Method to obtain the variance of the position quadrature using the Fourier transform under RWA.
+    def get_A_rwa(self, c):
+        """Method to obtain a new drift matrix under RWA.
 
         Parameters
         ----------
@@ -334,20 +505,67 @@ class MM_01(BaseSystem):
         
         Returns
         -------
-        var_Q_ft_rwa : float
-            Variance of the position quadrature.
+        A_rwa : numpy.ndarray
+            Drift matrix under RWA. For arrays of parameters, the matrices are stacked along the leading axes.
         """
 
         # extract frequently used variables
         gamma_norm = self.params['gamma_norm']
         kappa_norm = self.params['kappa_norm']
-        n_a, n_b = self.params['ns']
 
         # normalized effective couplings
         G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = self.get_params_G_norms(
             c=c
         )
 
+        # drift matrix
+        shape = np.broadcast(gamma_norm, kappa_norm, G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm).shape
+        A = np.zeros(shape + self.dim_corrs, dtype=np.float_)
+        # X quadratures
+        A[..., 0, 0] = - kappa_norm / 2.0
+        A[..., 0, 3] = - G_minus_norm
+        # Y quadratures
+        A[..., 1, 1] = - kappa_norm / 2.0
+        A[..., 1, 2] = G_plus_norm
+        # Q quadratures
+        A[..., 2, 1] = - G_minus_norm
+        A[..., 2, 2] = - gamma_norm / 2.0
+        A[..., 2, 3] = - G_tilde_minus_norm
+        # P quadratures
+        A[..., 3, 0] = G_plus_norm
+        A[..., 3, 2] = G_tilde_plus_norm
+        A[..., 3, 3] = - gamma_norm / 2.0
+
+        return A
+
+    def get_S_Q_rwa_num_den(self, c):
+        """Method to obtain the numerator and the denominator of the fluctuation spectrum of the position quadrature under RWA.
+
+        The spectrum is given by ``S_Q(omega_norm) = num(omega_norm) / den(omega_norm) / den(- omega_norm)``. For arrays of parameters, the frequencies broadcast against the parameters along an additional trailing axis.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        num : callable
+            Numerator of the spectrum, formatted as ``num(omega_norm)``.
+        den : callable
+            Factor of the denominator of the spectrum, formatted as ``den(omega_norm)``.
+        """
+
+        # extract frequently used variables with a trailing axis for the frequencies
+        gamma_norm = np.asarray(self.params['gamma_norm'])[..., None]
+        kappa_norm = np.asarray(self.params['kappa_norm'])[..., None]
+        n_a, n_b = [np.asarray(n)[..., None] for n in self.params['ns']]
+
+        # normalized effective couplings
+        G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = [np.asarray(G)[..., None] for G in self.get_params_G_norms(
+            c=c
+        )]
+
         # expressions
         _den = lambda omega_norm: (kappa_norm - 2.0j * omega_norm)**2 * (- 4.0 * G_tilde_minus_norm * G_tilde_plus_norm + (2.0 * omega_norm + 1.0j * gamma_norm)**2) + 8.0 * G_minus_norm * G_plus_norm * (2.0 * omega_norm + 1.0j * kappa_norm) * (2.0 * omega_norm + 1.0j * gamma_norm) - 16.0 * G_minus_norm**2 * G_plus_norm**2
         A_num = lambda omega_norm: 8.0 * G_plus_norm * np.sqrt(kappa_norm) * G_tilde_minus_norm * (kappa_norm - 2.0j * omega_norm)
@@ -355,8 +573,367 @@ class MM_01(BaseSystem):
         C_num = lambda omega_norm: 2.0 * (kappa_norm - 2.0j * omega_norm) * np.sqrt(gamma_norm) * (4.0 * G_minus_norm * G_plus_norm + (kappa_norm - 2.0j * omega_norm) * (gamma_norm - 2.0j * omega_norm))
         D_num = lambda omega: - 4.0 * G_tilde_minus_norm * (kappa_norm - 2.0j * omega)**2 * np.sqrt(gamma_norm)
 
+        # numerator of the fluctuation spectrum
+        _num = lambda omega_norm: (A_num(- omega_norm) * A_num(omega_norm) + B_num(- omega_norm) * B_num(omega_norm)) * (n_a + 0.5) + (C_num(- omega_norm) * C_num(omega_norm) + D_num(- omega_norm) * D_num(omega_norm)) * (n_b + 0.5)
+
+        return _num, _den
+
+    def get_S_Q_rwa_coeffs(self, c):
+        """Method to obtain the polynomial coefficients of the numerator and the denominator of the fluctuation spectrum of the position quadrature under RWA.
+
+        The spectrum is given by ``S_Q(omega_norm) = num(omega_norm) / den(omega_norm) / den(- omega_norm)``, where the polynomials are the same as those of :meth:`get_S_Q_rwa_num_den`.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        num : numpy.ndarray
+            Coefficients of the numerator with shape ``(*shape, 7)`` in the order of increasing degree.
+        den : numpy.ndarray
+            Coefficients of the factor of the denominator with shape ``(*shape, 5)`` in the order of increasing degree.
+        """
+
+        # extract frequently used variables
+        gamma_norm = self.params['gamma_norm']
+        kappa_norm = self.params['kappa_norm']
+        n_a, n_b = self.params['ns']
+
+        # normalized effective couplings
+        G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = self.get_params_G_norms(
+            c=c
+        )
+
+        # polynomials from coefficients and reflected polynomials
+        _poly = lambda *coeffs: np.stack(np.broadcast_arrays(*[np.asarray(coeff, dtype=np.complex_) for coeff in coeffs]), axis=-1)
+        _refl = lambda poly: poly * (- 1.0)**np.arange(poly.shape[-1])
+
+        # linear factors
+        _k_m = _poly(kappa_norm, - 2.0j)
+        _k_p = _poly(1.0j * kappa_norm, 2.0)
+        _g_m = _poly(gamma_norm, - 2.0j)
+        _g_p = _poly(1.0j * gamma_norm, 2.0)
+
+        # expressions
+        _den = get_poly_sum(
+            get_poly_product(_k_m, _k_m, get_poly_sum(_poly(- 4.0 * G_tilde_minus_norm * G_tilde_plus_norm), get_poly_product(_g_p, _g_p))),
+            get_poly_product(_poly(8.0 * G_minus_norm * G_plus_norm), _k_p, _g_p),
+            _poly(- 16.0 * G_minus_norm**2 * G_plus_norm**2)
+        )
+        A_num = get_poly_product(_poly(8.0 * G_plus_norm * np.sqrt(kappa_norm) * G_tilde_minus_norm), _k_m)
+        B_num = get_poly_product(_poly(4.0 * G_minus_norm * np.sqrt(kappa_norm)), get_poly_sum(_poly(- 4.0 * G_minus_norm * G_plus_norm), get_poly_product(_k_p, _g_p)))
+        C_num = get_poly_product(_poly(2.0 * np.sqrt(gamma_norm)), _k_m, get_poly_sum(_poly(4.0 * G_minus_norm * G_plus_norm), get_poly_product(_k_m, _g_m)))
+        D_num = get_poly_product(_poly(- 4.0 * G_tilde_minus_norm * np.sqrt(gamma_norm)), _k_m, _k_m)
+
+        # numerator of the fluctuation spectrum
+        _num = get_poly_sum(
+            get_poly_product(get_poly_sum(get_poly_product(_refl(A_num), A_num), get_poly_product(_refl(B_num), B_num)), _poly(n_a + 0.5)),
+            get_poly_product(get_poly_sum(get_poly_product(_refl(C_num), C_num), get_poly_product(_refl(D_num), D_num)), _poly(n_b + 0.5))
+        )
+
+        return _num, _den
+
+    def get_S_Q_rwa(self, omega_norms, c):
+        """Method to obtain the fluctuation spectrum of the position quadrature under RWA.
+
+        Parameters
+        ----------
+        omega_norms : numpy.ndarray
+            Normalized frequencies along the trailing axis.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        S_Q : numpy.ndarray
+            Fluctuation spectrum with shape ``(*shape, M)`` for ``M`` frequencies.
+        """
+
+        # numerator and denominator
+        _num, _den = self.get_S_Q_rwa_num_den(
+            c=c
+        )
+
+        return np.real(_num(omega_norms) / _den(- omega_norms) / _den(omega_norms))
+
+    def get_var_Q_ft_rwa(self, c, method='quad', dim=64):
+        r"""Method to obtain the variance of the position quadrature using the Fourier transform under RWA.
+
+        The poles of the spectrum are :math:`\pm i \lambda_{k}`, where :math:`\lambda_{k}` are the eigenvalues of the drift matrix under RWA.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        method : str, optional
+            Method to integrate the spectrum. Available options are:
+            ============    ====================================================
+            value           meaning
+            ============    ====================================================
+            "grid"          vectorized trapezoidal rule over a grid refined around the poles of the spectrum. Approximate, with relative errors up to :math:`10^{-5}` for the default ``dim``, and slower than ``'rational'`` for batches of parameters.
+            "quad"          ``scipy.integrate.quad`` over the real line (fallback). Supports only scalar parameters.
+            "rational"      sum of the residues at the poles in the upper half-plane, with the poles obtained from the polynomial coefficients of the spectrum.
+            "residue"       sum of the residues at the poles in the upper half-plane, with the poles obtained from the drift matrix. Falls back to ``'rational'`` for degenerate poles.
+            ============    ====================================================
+            Default is ``'quad'``.
+        dim : int, optional
+            Number of points per pole for the ``'grid'`` method. Default is :math:`64`.
+        
+        Returns
+        -------
+        var_Q_ft_rwa : float or numpy.ndarray
+            Variance of the position quadrature.
+        """
+
+        # validate method
+        assert method in ['grid', 'quad', 'rational', 'residue'], 'Parameter "method" should be either "grid", "quad", "rational" or "residue"'
+
+        # exact integral of the rational spectrum
+        if method == 'rational':
+            _num, _den = self.get_S_Q_rwa_coeffs(
+                c=c
+            )
+            return 1.0 / 2.0 / np.pi * get_rational_spectral_integral(
+                num=_num,
+                den=_den
+            )[()]
+
+        # numerator and denominator
+        _num, _den = self.get_S_Q_rwa_num_den(
+            c=c
+        )
+
         # fluctuation spectrum
-        S_Q = lambda omega_norm: (A_num(- omega_norm) * A_num(omega_norm) + B_num(- omega_norm) * B_num(omega_norm)) / _den(- omega_norm) / _den(omega_norm) * (n_a + 0.5) + (C_num(- omega_norm) * C_num(omega_norm) + D_num(- omega_norm) * D_num(omega_norm)) / _den(- omega_norm) / _den(omega_norm) * (n_b + 0.5)
+        S_Q = lambda omega_norm: _num(omega_norm) / _den(- omega_norm) / _den(omega_norm)
+
+        # quadrature over the real line
+        if method == 'quad':
+            return 1.0 / 2.0 / np.pi * si.quad(lambda omega_norm: np.real(S_Q(omega_norm))[0], -np.inf, np.inf)[0]
+
+        # eigenvalues of the drift matrix
+        lambdas = np.linalg.eigvals(self.get_A_rwa(
+            c=c
+        ))
+
+        # grid refined around the poles
+        if method == 'grid':
+            return 1.0 / 2.0 / np.pi * get_spectral_integral(
+                func=S_Q,
+                poles=np.concatenate((1.0j * lambdas, - 1.0j * lambdas), axis=-1),
+                dim=dim
+            )[()]
+
+        # residues at the simple poles - i lambda_k in the upper half-plane
+        # where den(omega) = - 16 det(A + i omega) = - 16 prod_j (lambda_j + i omega)
+        _diffs = lambdas[..., None, :] - lambdas[..., :, None]
+        _diffs[..., np.arange(lambdas.shape[-1]), np.arange(lambdas.shape[-1])] = 1.0
+        _den_p = - 16.0 * np.prod(lambdas[..., None, :] + lambdas[..., :, None], axis=-1)
+        _den_m_prime = 16.0j * np.prod(_diffs, axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            residues = _num(- 1.0j * lambdas) / _den_p / _den_m_prime
+        var_Q_ft_rwa = np.real(1.0j * np.sum(residues, axis=-1))
+
+        # poles of higher order, e.g., the degenerate pair - kappa / 2 for vanishing G_minus
+        _gaps = np.abs(_diffs)
+        _gaps[..., np.arange(lambdas.shape[-1]), np.arange(lambdas.shape[-1])] = np.inf
+        _is_degenerate = np.min(_gaps, axis=(-2, -1)) < 1e-8 * np.max(np.abs(lambdas), axis=-1)
+        if np.any(_is_degenerate):
+            var_Q_ft_rwa = np.where(_is_degenerate, self.get_var_Q_ft_rwa(
+                c=c,
+                method='rational'
+            ), var_Q_ft_rwa)
+
+        return var_Q_ft_rwa[()]
+
+class MM_01_Batch(MM_01):
+    r"""Class to simulate a batch of membrane-in-the-middle systems driven by a modulated laser using constant mode amplitudes.
+
+    Each of the scalar parameters of :class:`MM_01` (including the entries of ``alphas``, ``betas``, ``ns`` and ``Omega_norms``) can be replaced by an array, and all such arrays are broadcast against each other. The matrices are stacked along the leading axes, i.e., they have shape ``(*shape, 4, 4)``, where ``shape`` is the broadcast shape of the parameters.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the system. Refer to :class:`MM_01` for the keys.
+    cb_update : callable, optional
+        Callback function to update status and progress, formatted as ``cb_update(status, progress, reset)``, where ``status`` is a string, ``progress`` is an integer and ``reset`` is a boolean.
+    """
+
+    # keys of the parameters with multiple entries
+    list_keys = ['alphas', 'betas', 'ns', 'Omega_norms']
+
+    def __init__(self, params, cb_update=None):
+        """Class constructor for MM_01_Batch."""
+
+        # initialize super class
+        super().__init__(
+            params=params,
+            cb_update=cb_update
+        )
+        self.name = 'MM_01_Batch'
+
+        # convert parameters to arrays
+        shapes = list()
+        for key in self.system_defaults:
+            if key == 't_rwa':
+                continue
+            if key in self.list_keys:
+                self.params[key] = [np.asarray(val, dtype=np.float_) for val in self.params[key]]
+                shapes += [val.shape for val in self.params[key]]
+            else:
+                self.params[key] = np.asarray(self.params[key], dtype=np.float_)
+                shapes.append(self.params[key].shape)
+
+        # broadcast shape of the batch
+        self.shape = np.broadcast_shapes(*shapes)
+
+    def get_A(self, modes=None, c=None, t=0.0):
+        """Method to obtain the stacked drift matrices.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray, optional
+            Classical modes. Not required for this system.
+        c : numpy.ndarray, optional
+            Derived constants and controls. Not required for this system.
+        t : float, optional
+            Time at which the values are calculated. Default is :math:`0.0`.
+        
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrices with shape ``(*shape, 4, 4)``.
+        """
+
+        # extract frequently used variables
+        g_norm = self.params['g_norm']
+        gamma_norm = self.params['gamma_norm']
+        kappa_norm = self.params['kappa_norm']
+        Omega_a_norm, Omega_b_norm = self.params['Omega_norms']
+
+        # with RWA
+        if self.params['t_rwa']:
+            return np.broadcast_to(self.get_A_rwa(
+                c=c
+            ), self.shape + self.dim_corrs).copy()
+
+        # without RWA
+        else:
+            # extract frequently used variables
+            alpha_0, alpha_m, alpha_p = self.params['alphas']
+            beta_0, beta_m, beta_p = self.params['betas']
+            Delta_norm = self.params['Delta_norm']
+            
+            # modes
+            alpha = alpha_0 + alpha_m * np.exp(1.0j * Omega_a_norm * t) + alpha_p * np.exp(-1.0j * Omega_a_norm * t)
+            beta = beta_0 + beta_m * np.exp(1.0j * Omega_b_norm * t) + beta_p * np.exp(-1.0j * Omega_b_norm * t)
+
+            # stacked drift matrices
+            A = np.zeros(self.shape + self.dim_corrs, dtype=np.float_)
+
+            # frequently used expressions
+            G_x = 8.0 * g_norm * np.real(beta) * np.real(alpha)
+            G_y = 8.0 * g_norm * np.real(beta) * np.imag(alpha)
+
+            # X quadratures
+            A[..., 0, 0] = - kappa_norm / 2.0
+            A[..., 0, 1] = Delta_norm
+            A[..., 0, 2] = - G_y
+            # Y quadratures
+            A[..., 1, 0] = - Delta_norm
+            A[..., 1, 1] = - kappa_norm / 2.0
+            A[..., 1, 2] = G_x
+            # Q quadratures
+            A[..., 2, 2] = - gamma_norm / 2.0
+            A[..., 2, 3] = 1.0
+            # P quadratures
+            A[..., 3, 0] = G_x
+            A[..., 3, 1] = G_y
+            A[..., 3, 2] = - 1.0 + 4.0 * g_norm * np.abs(alpha)**2
+            A[..., 3, 3] = - gamma_norm / 2.0
 
-        # variance
-        return 1.0 / 2.0 / np.pi * si.quad(S_Q, -np.inf, np.inf)[0]
\ No newline at end of file
+        return A
+
+    def get_D(self, modes=None, corrs=None, c=None, t=0.0):
+        """Method to obtain the stacked noise matrices.
+        
+        Parameters
+        ----------
+        modes : numpy.ndarray, optional
+            Classical modes. Not required for this system.
+        corrs : numpy.ndarray, optional
+            Quantum correlations. Not required for this system.
+        c : numpy.ndarray, optional
+            Derived constants and controls. Not required for this system.
+        t : float, optional
+            Time at which the values are calculated. Default is :math:`0.0`.
+        
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrices with shape ``(*shape, 4, 4)``.
+        """
+
+        # extract frequently used variables
+        gamma_norm = self.params['gamma_norm']
+        kappa_norm = self.params['kappa_norm']
+        n_a, n_b = self.params['ns']
+
+        # stacked noise matrices
+        D = np.zeros(self.shape + self.dim_corrs, dtype=np.float_)
+        
+        # optical mode
+        D[..., 0, 0] = kappa_norm * (n_a + 0.5)
+        D[..., 1, 1] = kappa_norm * (n_a + 0.5)
+        # mechanical mode
+        D[..., 2, 2] = gamma_norm * (n_b + 0.5)
+        D[..., 3, 3] = gamma_norm * (n_b + 0.5)
+
+        return D
+    
+    def get_ivc(self):
+        """Method to obtain the initial values of the modes, correlations and derived constants and controls.
+        
+        Returns
+        -------
+        iv_modes : numpy.ndarray
+            Initial values of the classical modes with shape ``(*shape, 2)``.
+        iv_corrs : numpy.ndarray
+            Initial values of the quantum correlations with shape ``(*shape, 4, 4)``.
+        c : numpy.ndarray
+            Derived constants and controls.
+        """
+
+        # extract frequently used variables
+        n_a, n_b = self.params['ns']
+ 
+        # initial mode values
+        iv_modes = np.zeros(self.shape + (self.num_modes, ), dtype=np.complex_)
+
+        # initial quadrature correlations
+        iv_corrs = np.zeros(self.shape + self.dim_corrs, dtype=np.float_)
+        iv_corrs[..., 0, 0] = n_a + 0.5
+        iv_corrs[..., 1, 1] = n_a + 0.5
+        iv_corrs[..., 2, 2] = n_b + 0.5
+        iv_corrs[..., 3, 3] = n_b + 0.5
+
+        return iv_modes, iv_corrs, np.empty(0)
+
+    def get_var_Q_ss_rwa(self, c=None):
+        """Method to obtain the stacked steady-state variances of the position quadrature under RWA.
+
+        Parameters
+        ----------
+        c : numpy.ndarray, optional
+            Derived constants and controls. Not required for this system.
+        
+        Returns
+        -------
+        var_Q_ss_rwa : numpy.ndarray
+            Variances of the position quadrature with shape ``shape``.
+        """
+
+        return np.broadcast_to(super().get_var_Q_ss_rwa(
+            c=c
+        ), self.shape)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to export animations of the distributions of linearized systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import collections
+import logging
+import matplotlib
+import matplotlib.backends.backend_agg as mpl_agg
+import matplotlib.cm as mpl_cm
+import matplotlib.colors as mpl_colors
+import matplotlib.figure as mpl_figure
+import multiprocessing
+import numpy as np
+import os
+import subprocess
+
+# local modules
+from solvers.measure import get_Wigner_distributions_single_mode
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# animation of the current worker process
+_animation = None
+
+def _init_worker(animation):
+    """Function to set the animation rendered by a worker process."""
+
+    global _animation
+    _animation = animation
+
+def _render_frame(idx):
+    """Function to render a frame in a worker process."""
+
+    return _animation.render(idx)
+
+class WignerAnimation():
+    r"""Class to export the Wigner distributions of a mode over a trajectory of correlations as a headless animation.
+
+    Each frame is evaluated only when it is rendered using :func:`solvers.measure.get_Wigner_distributions_single_mode`. The frames are rendered by processes that each reuse a single figure with its axes and colorbar, replacing only the filled contours and the title between frames. They are written to an image sequence by the processes themselves, or streamed in order as raw RGBA to FFmpeg to encode a video, with at most two frames per process pending at a time, so that the memory is bounded irrespective of their number.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray
+        Quadrature correlations with shape ``(T, 2n, 2n)``.
+    T : numpy.ndarray
+        Times of the correlations.
+    params : dict
+        Parameters for the animation. The animation parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        file_path           (*str*) path of the output, either a directory of the image sequence or a video file with the extension ``'.mp4'``, ``'.mkv'``, ``'.avi'`` or ``'.gif'``.
+        xs                  (*numpy.ndarray*) values of the first quadrature.
+        ys                  (*numpy.ndarray*) values of the second quadrature.
+        pos                 (*int*) index of the mode. Default is :math:`0`.
+        frames              (*list*) indices of the frames to export. Default is ``None`` (all).
+        dtype               (*numpy.dtype*) type of the distributions. Default is ``numpy.float32``.
+        v_levels            (*list*) levels of the filled contours. Default is :math:`65` levels from :math:`0` to :math:`1 / \pi`, the maximum of a physical state.
+        cmap                (*str*) colormap of the contours. Default is ``'viridis'``.
+        x_label             (*str*) label of the X-axis. Default is ``'$Q$'``.
+        y_label             (*str*) label of the Y-axis. Default is ``'$P$'``.
+        title               (*str*) title formatted with the time of the frame. Default is ``'$\omega_{{m}} t = {:0.1f}$'``.
+        width               (*float*) width of the figure in inches. Default is :math:`2.75`.
+        height              (*float*) height of the figure in inches. Default is :math:`2.5`.
+        dpi                 (*int*) resolution of the figure in dots per inch. Default is :math:`200`.
+        fps                 (*int*) frames per second of the video. Default is :math:`30`.
+        num_processes       (*int*) number of processes over which the frames are rendered. Default is the number of CPUs.
+        show_progress       (*bool*) option to log the progress. Default is ``False``.
+        ================    ====================================================
+    """
+
+    # default animation parameters
+    animation_defaults = {
+        'file_path'     : None,
+        'xs'            : None,
+        'ys'            : None,
+        'pos'           : 0,
+        'frames'        : None,
+        'dtype'         : np.float32,
+        'v_levels'      : np.linspace(0.0, 1.0 / np.pi, 65),
+        'cmap'          : 'viridis',
+        'x_label'       : '$Q$',
+        'y_label'       : '$P$',
+        'title'         : '$\\omega_{{m}} t = {:0.1f}$',
+        'width'         : 2.75,
+        'height'        : 2.5,
+        'dpi'           : 200,
+        'fps'           : 30,
+        'num_processes' : None,
+        'show_progress' : False
+    }
+
+    # extensions of the video files
+    video_extensions = ['.mp4', '.mkv', '.avi', '.gif']
+
+    def __init__(self, corrs, T, params):
+        """Class constructor for WignerAnimation."""
+
+        # set attributes
+        self.corrs = np.asarray(corrs)
+        self.T = np.asarray(T)
+        self.params = dict()
+        for key in self.animation_defaults:
+            self.params[key] = params.get(key, self.animation_defaults[key])
+
+        # validate parameters
+        assert self.params['file_path'] is not None, 'Parameter "file_path" should be provided'
+        assert self.params['xs'] is not None and self.params['ys'] is not None, 'Parameters "xs" and "ys" should be provided'
+        assert len(self.corrs) == len(self.T), 'Correlations and times should have the same length'
+
+        # frames and output
+        self.frames = list(range(len(self.T))) if self.params['frames'] is None else list(self.params['frames'])
+        self.is_video = os.path.splitext(self.params['file_path'])[1].lower() in self.video_extensions
+
+        # initialize variables
+        self.figure = None
+        self.axes = None
+        self.norm = None
+        self.title = None
+        self.contours = None
+
+    def get_figure(self):
+        """Method to obtain the figure of the process, creating it if it does not exist.
+
+        Returns
+        -------
+        figure : :class:`matplotlib.figure.Figure`
+            Figure with the axes, the colorbar and the title.
+        """
+
+        if self.figure is None:
+            # headless figure
+            self.figure = mpl_figure.Figure(
+                figsize=(self.params['width'], self.params['height']),
+                dpi=self.params['dpi']
+            )
+            mpl_agg.FigureCanvasAgg(self.figure)
+            self.axes = self.figure.add_subplot()
+            self.axes.set_xlabel(self.params['x_label'])
+            self.axes.set_ylabel(self.params['y_label'])
+            self.axes.set_xlim(np.min(self.params['xs']), np.max(self.params['xs']))
+            self.axes.set_ylim(np.min(self.params['ys']), np.max(self.params['ys']))
+
+            # colorbar of the fixed levels
+            v_levels = self.params['v_levels']
+            self.norm = mpl_colors.Normalize(vmin=v_levels[0], vmax=v_levels[-1])
+            self.figure.colorbar(mpl_cm.ScalarMappable(
+                norm=self.norm,
+                cmap=self.params['cmap']
+            ), ax=self.axes)
+            self.title = self.axes.set_title(self.params['title'].format(self.T[0]))
+
+            # layout is fixed for all the frames
+            self.figure.tight_layout()
+
+        return self.figure
+
+    def get_frame_path(self, idx):
+        """Method to obtain the path of a frame of the image sequence.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the frame.
+
+        Returns
+        -------
+        frame_path : str
+            Path of the image of the frame.
+        """
+
+        return os.path.join(self.params['file_path'], 'frame_{:05d}.png'.format(idx))
+
+    def render(self, idx):
+        """Method to render a frame.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the frame.
+
+        Returns
+        -------
+        frame : bytes or str
+            Raw RGBA data of the frame for a video, or the path of its image for an image sequence.
+        """
+
+        # extract frequently used variables
+        figure = self.get_figure()
+        Wigner = get_Wigner_distributions_single_mode(
+            corrs=self.corrs,
+            xs=self.params['xs'],
+            ys=self.params['ys'],
+            pos=self.params['pos'],
+            frames=[idx],
+            dtype=self.params['dtype']
+        )[0]
+
+        # replace the contours and the title
+        if self.contours is not None:
+            self.contours.remove()
+        self.contours = self.axes.contourf(self.params['xs'], self.params['ys'], Wigner,
+            levels=self.params['v_levels'],
+            cmap=self.params['cmap'],
+            norm=self.norm,
+            extend='max'
+        )
+        self.title.set_text(self.params['title'].format(self.T[idx]))
+
+        # video frame
+        if self.is_video:
+            figure.canvas.draw()
+            return bytes(figure.canvas.buffer_rgba())
+
+        # image of the sequence
+        frame_path = self.get_frame_path(idx)
+        figure.savefig(frame_path)
+
+        return frame_path
+
+    def get_video_writer(self):
+        """Method to obtain the FFmpeg process encoding the raw frames of the video.
+
+        Returns
+        -------
+        writer : :class:`subprocess.Popen`
+            Process reading the frames from its standard input.
+        """
+
+        # size of the frames in pixels, as truncated by the canvas
+        width, height = int(self.params['width'] * self.params['dpi']), int(self.params['height'] * self.params['dpi'])
+
+        return subprocess.Popen([
+            matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', '{}x{}'.format(width, height), '-r', str(self.params['fps']), '-i', '-',
+            '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2'
+        ] + (['-pix_fmt', 'yuv420p'] if not self.params['file_path'].lower().endswith('.gif') else []) + [self.params['file_path']], stdin=subprocess.PIPE)
+
+    def export(self):
+        """Method to render the frames and write them to the output.
+
+        Returns
+        -------
+        file_path : str
+            Path of the output.
+        """
+
+        # extract frequently used variables
+        num_frames = len(self.frames)
+        num_processes = self.params['num_processes'] if self.params['num_processes'] is not None else os.cpu_count()
+        dir_name = self.params['file_path'] if not self.is_video else os.path.dirname(self.params['file_path'])
+        if dir_name != '':
+            os.makedirs(dir_name, exist_ok=True)
+        writer = self.get_video_writer() if self.is_video else None
+
+        # function to write a rendered frame
+        def write(i, frame):
+            if writer is not None:
+                writer.stdin.write(frame)
+            if self.params['show_progress'] and (i + 1) % 100 == 0:
+                logger.info('Rendered {} of {} frames\n'.format(i + 1, num_frames))
+
+        try:
+            # distribute over processes with a bounded window of pending frames, written in order
+            if num_processes > 1 and num_frames > 1:
+                num_processes = min(num_processes, num_frames)
+                with multiprocessing.Pool(num_processes, initializer=_init_worker, initargs=(self, )) as pool:
+                    pending = collections.deque()
+                    i = 0
+                    for idx in self.frames:
+                        pending.append(pool.apply_async(_render_frame, (idx, )))
+                        if len(pending) >= 2 * num_processes:
+                            write(i, pending.popleft().get())
+                            i += 1
+                    while len(pending) > 0:
+                        write(i, pending.popleft().get())
+                        i += 1
+            else:
+                for i, idx in enumerate(self.frames):
+                    write(i, self.render(idx))
+        finally:
+            if writer is not None:
+                writer.stdin.close()
+                writer.wait()
+
+        # encoding errors
+        if writer is not None:
+            assert writer.returncode == 0, 'FFmpeg failed to encode {}'.format(self.params['file_path'])
+
+        return self.params['file_path']
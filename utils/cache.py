@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to cache the results of individual sweep points."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import hashlib
+import json
+import numpy as np
+import os
+import sys
+
+def get_canonical_params(params):
+    """Function to obtain a JSON-serializable copy of parameters with a stable ordering.
+
+    Parameters
+    ----------
+    params : any
+        Parameters containing dictionaries, lists, tuples, NumPy arrays, NumPy scalars or Python scalars.
+
+    Returns
+    -------
+    canonical_params : any
+        Parameters with dictionaries sorted by their keys and arrays converted to lists.
+    """
+
+    if isinstance(params, dict):
+        return {str(key): get_canonical_params(params[key]) for key in sorted(params, key=str)}
+    if isinstance(params, (list, tuple)):
+        return [get_canonical_params(val) for val in params]
+    if isinstance(params, np.ndarray):
+        return get_canonical_params(params.tolist())
+    if isinstance(params, np.generic):
+        return params.item()
+    if params is None or isinstance(params, (bool, int, float, str)):
+        return params
+    return repr(params)
+
+def get_cache_key(*params):
+    """Function to obtain the content-addressed key of a set of parameters.
+
+    Parameters
+    ----------
+    *params : any
+        Parameters to hash.
+
+    Returns
+    -------
+    key : str
+        Hexadecimal SHA-256 digest of the canonical JSON representation of the parameters.
+    """
+
+    return hashlib.sha256(json.dumps(get_canonical_params(list(params)), sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+def get_func_name(func):
+    """Function to obtain the stable name of a function, including those of the functions wrapped by a callable instance.
+
+    Functions defined in a script run as the main module are named by the file name of the script, so that the functions of different scripts have different names.
+
+    Parameters
+    ----------
+    func : callable
+        Function or instance of a callable class.
+
+    Returns
+    -------
+    name : str
+        Module and qualified name of the function, or of the class of the instance followed by the names of its callable attributes.
+    """
+
+    # functions and methods
+    if hasattr(func, '__qualname__'):
+        module_name = getattr(func, '__module__', None)
+        if module_name in ['__main__', '__mp_main__'] and getattr(sys.modules.get(module_name), '__file__', None) is not None:
+            module_name = os.path.splitext(os.path.basename(sys.modules[module_name].__file__))[0]
+        return '{}.{}'.format(module_name, func.__qualname__)
+
+    # callable instances, without their addresses in memory
+    name = '{}.{}'.format(type(func).__module__, type(func).__qualname__)
+    attrs = getattr(func, '__dict__', {})
+    funcs = [get_func_name(attrs[key]) for key in sorted(attrs) if callable(attrs[key])]
+
+    return name + ('(' + ', '.join(funcs) + ')' if len(funcs) > 0 else '')
+
+def get_func_code(func):
+    """Function to obtain the bytecode, the constants and the referenced names of a function, including those of the functions wrapped by a callable instance.
+
+    Parameters
+    ----------
+    func : callable
+        Function or instance of a callable class.
+
+    Returns
+    -------
+    code : list
+        Canonical representation of the code, which changes with the body of the function.
+    """
+
+    # code objects, including those of the nested functions
+    def get_code(code):
+        consts = list()
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                consts.append(get_code(const))
+            elif isinstance(const, frozenset):
+                consts.append(sorted(repr(val) for val in const))
+            else:
+                consts.append(repr(const))
+        return [code.co_code.hex(), consts, list(code.co_names)]
+
+    # functions and methods
+    code = getattr(getattr(func, '__func__', func), '__code__', None)
+    if code is not None:
+        return get_code(code)
+
+    # callable instances and builtins
+    attrs = getattr(func, '__dict__', {})
+
+    return [get_func_code(attrs[key]) for key in sorted(attrs) if callable(attrs[key])]
+
+class PointCache():
+    """Class to cache the results of individual sweep points on the disk.
+
+    Each result is stored as a ``.npy`` file named by the key of the parameters that produced it, so that overlapping or refined sweeps reuse the points already obtained. The least recently used files are removed once the total size of the cache exceeds the limit.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the cache. The cache parameters are:
+        ============    ========================================================
+        key             meaning
+        ============    ========================================================
+        cache_dir       (*str*) directory of the cache. Default is ``'data/cache'``.
+        max_size        (*int*) maximum total size of the cached files in bytes. Default is :math:`2^{30}`.
+        ============    ========================================================
+
+    Notes
+    -----
+    The total size is tracked per instance and recounted from the disk only when it exceeds the limit. When several processes write to the same directory, the limit is therefore approximate.
+    """
+
+    # default cache parameters
+    cache_defaults = {
+        'cache_dir' : 'data/cache',
+        'max_size'  : 2**30
+    }
+
+    def __init__(self, params={}):
+        """Class constructor for PointCache."""
+
+        # set attributes
+        self.params = dict()
+        for key in self.cache_defaults:
+            self.params[key] = params.get(key, self.cache_defaults[key])
+
+        # validate parameters
+        assert self.params['max_size'] > 0, 'Parameter "max_size" should be positive'
+
+        # initialize directory and size
+        os.makedirs(self.params['cache_dir'], exist_ok=True)
+        self.size = sum([size for _, size, _ in self.get_entries()])
+
+    def get_file_path(self, key):
+        """Method to obtain the path of the file for a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        file_path : str
+            Path of the file, fanned out into subdirectories by the first two characters of the key.
+        """
+
+        return os.path.join(self.params['cache_dir'], key[:2], key + '.npy')
+
+    def get_entries(self):
+        """Method to obtain the entries of the cache.
+
+        Returns
+        -------
+        entries : list
+            Tuples of file path, size and last access time of each entry.
+        """
+
+        entries = list()
+        for root, _, file_names in os.walk(self.params['cache_dir']):
+            for file_name in file_names:
+                if not file_name.endswith('.npy'):
+                    continue
+                file_path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                entries.append((file_path, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    def get(self, key):
+        """Method to obtain a cached result.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        value : numpy.ndarray
+            Cached result. ``None`` if the entry does not exist.
+        """
+
+        file_path = self.get_file_path(key)
+        try:
+            value = np.load(file_path, allow_pickle=False)
+            # mark as recently used
+            os.utime(file_path)
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+        return value
+
+    def set(self, key, value):
+        """Method to cache a result.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        value : numpy.ndarray
+            Result to cache.
+        """
+
+        file_path = self.get_file_path(key)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # write atomically
+        tmp_path = file_path[:-4] + '.{}.tmp'.format(os.getpid())
+        with open(tmp_path, 'wb') as file:
+            np.save(file, np.asarray(value), allow_pickle=False)
+        os.replace(tmp_path, file_path)
+
+        # evict if required
+        self.size += os.path.getsize(file_path)
+        if self.size > self.params['max_size']:
+            self.evict()
+
+    def evict(self):
+        """Method to remove the least recently used entries until the cache fits its size limit."""
+
+        entries = sorted(self.get_entries(), key=lambda entry: entry[2])
+        self.size = sum([size for _, size, _ in entries])
+        for file_path, size, _ in entries:
+            if self.size <= self.params['max_size']:
+                break
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+            self.size -= size
+
+    def wrap(self, func, params_solver={}, version=None):
+        """Method to wrap a function of the system parameters with the cache.
+
+        Parameters
+        ----------
+        func : callable
+            Function returning the result of a point, formatted as ``func(system_params)``.
+        params_solver : dict, optional
+            Solver parameters used by the function, which are included in the key.
+        version : any, optional
+            Version of the function, which is included in the key. Default is ``None``.
+
+        Returns
+        -------
+        cached_func : :class:`utils.cache.CachedFunction`
+            Picklable function returning the cached result when available.
+        """
+
+        return CachedFunction(
+            func=func,
+            cache=self,
+            params_solver=params_solver,
+            version=version
+        )
+
+class CachedFunction():
+    """Class to evaluate a function of the system parameters through a :class:`PointCache`.
+
+    The key of each point is obtained from the module-qualified name and the code of the function, an optional version, the system parameters and the solver parameters. Editing the body of the function therefore invalidates its cached results, while changes to the functions it calls, e.g., the methods of the system, require a new version.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the result of a point, formatted as ``func(system_params)``.
+    cache : :class:`utils.cache.PointCache`
+        Instance of the cache.
+    params_solver : dict
+        Solver parameters used by the function.
+    version : any, optional
+        Version of the function included in the key. Default is ``None``.
+    """
+
+    def __init__(self, func, cache, params_solver, version=None):
+        """Class constructor for CachedFunction."""
+
+        # set attributes
+        self.func = func
+        self.cache = cache
+        self.params_solver = params_solver
+        self.version = version
+
+        # key of the function
+        self.func_key = get_cache_key(get_func_name(func), get_func_code(func), version)
+
+    def __call__(self, system_params):
+        """Method to obtain the result of a point.
+
+        Parameters
+        ----------
+        system_params : dict
+            Parameters of the system at the point.
+
+        Returns
+        -------
+        value : numpy.ndarray
+            Result of the point.
+        """
+
+        # key before the function updates the parameters
+        key = get_cache_key(self.func_key, system_params, self.params_solver)
+
+        # cached result
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        # evaluate and cache
+        value = self.func(system_params)
+        self.cache.set(key, value)
+
+        return value
@@ -0,0 +1,941 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module with loopers to sweep the parameters of systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import copy
+import json
+import logging
+import multiprocessing
+import numpy as np
+import os
+import shutil
+import socket
+import threading
+import time
+
+# local modules
+from utils.cache import get_cache_key, get_func_name
+from utils.store import load_values, save_sweep
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# golden ratio conjugate
+_inv_phi = (np.sqrt(5.0) - 1.0) / 2.0
+
+def get_axis_values(axis_params):
+    """Function to obtain the values of a looper axis.
+
+    Parameters
+    ----------
+    axis_params : dict
+        Parameters of the axis with keys ``'min'``, ``'max'``, ``'dim'`` and optionally ``'scale'`` (``'linear'`` or ``'log'``), or with the key ``'val'`` containing the values.
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Values of the axis.
+    """
+
+    # explicit values
+    if axis_params.get('val', None) is not None:
+        return np.array(axis_params['val'], dtype=np.float_)
+
+    # logarithmic scale
+    if axis_params.get('scale', 'linear') == 'log':
+        return np.logspace(np.log10(axis_params['min']), np.log10(axis_params['max']), axis_params['dim'])
+
+    return np.linspace(axis_params['min'], axis_params['max'], axis_params['dim'])
+
+def get_file_path(file_path_prefix, params_axes):
+    """Function to obtain the path of the data file of a looper named as per the toolbox.
+
+    Parameters
+    ----------
+    file_path_prefix : str
+        Prefix of the path.
+    params_axes : dict
+        Parameters of the axes keyed by ``'X'``, ``'Y'`` and optionally ``'Z'``, each with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` and optionally ``'idx'``.
+
+    Returns
+    -------
+    file_path : str
+        Path of the data file, e.g., ``'{prefix}_x=beta_pm_sum_75.0_225.0_301_y=ns_1_0.001_100000.0_81.npz'``.
+    """
+
+    file_path = file_path_prefix
+    for axis in ['X', 'Y', 'Z']:
+        axis_params = params_axes.get(axis, None)
+        if axis_params is None:
+            continue
+        file_path += '_{}={}'.format(axis.lower(), axis_params['var'])
+        if axis_params.get('idx', None) is not None:
+            file_path += '_{}'.format(axis_params['idx'])
+        file_path += '_{}_{}_{}'.format(float(axis_params['min']), float(axis_params['max']), axis_params['dim'])
+
+    return file_path + '.npz'
+
+def get_params_updated(system_params, axis_params, val):
+    """Function to obtain a copy of the system parameters with the variable of an axis updated.
+
+    Parameters
+    ----------
+    system_params : dict
+        Parameters of the system.
+    axis_params : dict
+        Parameters of the axis with keys ``'var'`` and optionally ``'idx'`` for list-valued parameters.
+    val : float
+        Value of the variable.
+
+    Returns
+    -------
+    params : dict
+        Updated copy of the parameters.
+    """
+
+    params = copy.deepcopy(system_params)
+    if axis_params.get('idx', None) is not None:
+        params[axis_params['var']][axis_params['idx']] = val
+    else:
+        params[axis_params['var']] = val
+
+    return params
+
+def get_optimum_golden(func, x_min, x_max, tol, max_iter=100, f_min=None, f_max=None):
+    """Function to locate the minimum of a unimodal function in a bracket using the golden-section search.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the value to minimize, formatted as ``func(x)``.
+    x_min : float
+        Lower end of the bracket.
+    x_max : float
+        Upper end of the bracket.
+    tol : float
+        Absolute tolerance in the argument.
+    max_iter : int, optional
+        Maximum number of iterations. Default is :math:`100`.
+
+    Returns
+    -------
+    x_opt : float
+        Argument of the minimum.
+    f_opt : float
+        Value at the minimum.
+    num_evals : int
+        Number of evaluations of the function.
+    """
+
+    # interior points
+    a, b = x_min, x_max
+    c = b - _inv_phi * (b - a)
+    d = a + _inv_phi * (b - a)
+    f_c = func(c)
+    f_d = func(d)
+    num_evals = 2
+
+    # shrink the bracket
+    for _ in range(max_iter):
+        if b - a <= tol:
+            break
+        if f_c <= f_d:
+            b, d, f_d = d, c, f_c
+            c = b - _inv_phi * (b - a)
+            f_c = func(c)
+        else:
+            a, c, f_c = c, d, f_d
+            d = a + _inv_phi * (b - a)
+            f_d = func(d)
+        num_evals += 1
+
+    return (c, f_c, num_evals) if f_c <= f_d else (d, f_d, num_evals)
+
+class AdaptiveXYLooper():
+    """Class to locate the optimum along the X-axis for each value of the Y-axis.
+
+    For each value of the Y-axis, a coarse scan over the ``dim`` values of the X-axis brackets the optimum, which is then refined by a golden-section search up to the tolerance or by a given refiner. Only the results at the optimum are retained.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the results of a point as an array, formatted as ``func(system_params)``.
+    params : dict
+        Parameters for the looper. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        X                   (*dict*) parameters of the X-axis with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` (number of points in the coarse scan) and optionally ``'idx'``.
+        Y                   (*dict*) parameters of the Y-axis with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` and optionally ``'idx'`` and ``'scale'``.
+        v_index             (*int*) index of the result to optimize. Default is :math:`-1`.
+        v_mode              (*str*) type of optimum, either ``'min'`` or ``'max'``. Default is ``'min'``.
+        tol                 (*float*) absolute tolerance of the optimum along the X-axis. Default is :math:`10^{-3}`.
+        max_iter            (*int*) maximum number of iterations of the golden-section search. Default is :math:`100`.
+        refine              (*callable*) function refining the optimum in the bracket of the coarse scan instead of the golden-section search, formatted as ``refine(system_params, x_min, x_max)`` and returning the value of the X-axis at the optimum and the number of evaluations it required, e.g., using :class:`utils.optimizers.SteadyStateOptimizer`. Default is ``None``.
+        num_processes       (*int*) number of processes over which the values of the Y-axis are distributed. Default is the number of CPUs.
+        show_progress       (*bool*) option to log the progress. Default is ``False``.
+        ================    ====================================================
+    params_system : dict
+        Parameters of the system.
+    """
+
+    # default looper parameters
+    looper_defaults = {
+        'X'             : None,
+        'Y'             : None,
+        'v_index'       : -1,
+        'v_mode'        : 'min',
+        'tol'           : 1e-3,
+        'max_iter'      : 100,
+        'refine'        : None,
+        'num_processes' : None,
+        'show_progress' : False
+    }
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for AdaptiveXYLooper."""
+
+        # set attributes
+        self.func = func
+        self.params = dict()
+        for key in self.looper_defaults:
+            self.params[key] = params.get(key, self.looper_defaults[key])
+        self.params_system = params_system
+
+        # validate parameters
+        assert self.params['X'] is not None and self.params['Y'] is not None, 'Parameters "X" and "Y" should be provided'
+        assert self.params['X'].get('dim', 0) >= 3, 'Parameter "dim" of the X-axis should be at least 3'
+        assert self.params['v_mode'] in ['min', 'max'], 'Parameter "v_mode" should be either "min" or "max"'
+
+        # axes
+        self.axes = {
+            'X' : {
+                'var'   : self.params['X']['var'],
+                'val'   : get_axis_values(self.params['X'])
+            },
+            'Y' : {
+                'var'   : self.params['Y']['var'],
+                'val'   : get_axis_values(self.params['Y'])
+            }
+        }
+
+        # initialize variables
+        self.results = dict()
+
+    def get_optimum(self, y):
+        """Method to obtain the optimum along the X-axis for a value of the Y-axis.
+
+        Parameters
+        ----------
+        y : float
+            Value of the Y-axis.
+
+        Returns
+        -------
+        x_opt : float
+            Value of the X-axis at the optimum.
+        v_opt : numpy.ndarray
+            Results at the optimum.
+        num_evals : int
+            Number of evaluations of the function.
+        """
+
+        # extract frequently used variables
+        params_x = self.params['X']
+        v_index = self.params['v_index']
+        sign = 1.0 if self.params['v_mode'] == 'min' else - 1.0
+        params_y = get_params_updated(self.params_system, self.params['Y'], y)
+        results = dict()
+
+        # memoized evaluation of the objective
+        def func_obj(x):
+            if x not in results:
+                results[x] = np.asarray(self.func(get_params_updated(params_y, params_x, x)), dtype=np.float_)
+            # non-finite values are never optimal
+            v = sign * results[x][v_index]
+            return v if np.isfinite(v) else np.inf
+
+        # coarse scan
+        xs = self.axes['X']['val']
+        idx = int(np.argmin([func_obj(x) for x in xs]))
+
+        # refine in the bracket around the coarse optimum
+        x_min = xs[max(idx - 1, 0)]
+        x_max = xs[min(idx + 1, len(xs) - 1)]
+        if self.params['refine'] is not None:
+            x_opt, num_evals = self.params['refine'](params_y, x_min, x_max)
+            # the results are evaluated once more at the refined optimum
+            x_opt, num_evals = float(x_opt), num_evals + 1
+        else:
+            x_opt, _, num_evals = get_optimum_golden(
+                func=func_obj,
+                x_min=x_min,
+                x_max=x_max,
+                tol=self.params['tol'],
+                max_iter=self.params['max_iter']
+            )
+        # the coarse point may be better at the edges
+        if func_obj(xs[idx]) < func_obj(x_opt):
+            x_opt = xs[idx]
+
+        return x_opt, results[x_opt], len(xs) + num_evals
+
+    def loop(self):
+        """Method to loop over the values of the Y-axis.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with keys ``'X'`` (values of the X-axis at the optima), ``'V'`` (results at the optima) and ``'num_evals'`` (number of evaluations for each value of the Y-axis).
+        """
+
+        # extract frequently used variables
+        ys = self.axes['Y']['val']
+        num_processes = self.params['num_processes'] if self.params['num_processes'] is not None else os.cpu_count()
+
+        # distribute over processes one value at a time
+        if num_processes > 1 and len(ys) > 1:
+            with multiprocessing.Pool(min(num_processes, len(ys))) as pool:
+                outputs = list(pool.imap(self.get_optimum, ys, chunksize=1))
+        else:
+            outputs = list()
+            for i, y in enumerate(ys):
+                outputs.append(self.get_optimum(y))
+                if self.params['show_progress']:
+                    logger.info('Optimized {} of {} values of {}\n'.format(i + 1, len(ys), self.axes['Y']['var']))
+
+        # update results
+        self.results = {
+            'X'         : np.array([output[0] for output in outputs], dtype=np.float_),
+            'V'         : np.array([output[1] for output in outputs], dtype=np.float_),
+            'num_evals' : np.array([output[2] for output in outputs], dtype=np.int_)
+        }
+
+        return self.results
+
+class ChunkedXYLooper():
+    """Class to sweep a two-dimensional grid in tiles that are checkpointed as they complete.
+
+    The grid of values of the Y-axis and the X-axis is partitioned into tiles, each of which is evaluated by a single process. The results are preallocated as a memory-mapped ``.npy`` buffer filled with ``NaN`` in a directory next to the data file, into whose slots the processes write the values of the points in place, so that no results are passed between the processes and the partial results can be inspected with ``numpy.load(looper.buffer_path, mmap_mode='r')`` during the sweep. Once a tile is written to disk, its checkpoint marker is created, and an interrupted sweep therefore resumes from the remaining tiles. Once all the tiles are available, the buffer is moved into a data store named as per the toolbox without the extension (see :func:`utils.store.save_sweep`) and the directory is removed. If the data store already exists, the results are memory-mapped from it, and if only a data file of the toolbox exists, the results are loaded from it.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the results of a point as an array, formatted as ``func(system_params)``.
+    params : dict
+        Parameters for the looper. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        X                   (*dict*) parameters of the X-axis with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` and optionally ``'idx'`` and ``'scale'``.
+        Y                   (*dict*) parameters of the Y-axis with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` and optionally ``'idx'`` and ``'scale'``.
+        file_path_prefix    (*str*) prefix of the path of the data file.
+        metadata            (*dict*) additional parameters written to the header of the data store, e.g., those of the solver. Default is ``{}``.
+        tile_shape          (*tuple*) number of values of the Y-axis and the X-axis in each tile, where ``None`` denotes all the values. Default is ``(1, None)``.
+        num_processes       (*int*) number of processes over which the tiles are distributed. Default is the number of CPUs.
+        show_progress       (*bool*) option to log the progress. Default is ``False``.
+        ================    ====================================================
+    params_system : dict
+        Parameters of the system.
+    """
+
+    # default looper parameters
+    looper_defaults = {
+        'X'                 : None,
+        'Y'                 : None,
+        'file_path_prefix'  : None,
+        'metadata'          : {},
+        'tile_shape'        : (1, None),
+        'num_processes'     : None,
+        'show_progress'     : False
+    }
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for ChunkedXYLooper."""
+
+        # set attributes
+        self.func = func
+        self.params = dict()
+        for key in self.looper_defaults:
+            self.params[key] = params.get(key, self.looper_defaults[key])
+        self.params_system = params_system
+
+        # validate parameters
+        assert self.params['X'] is not None and self.params['Y'] is not None, 'Parameters "X" and "Y" should be provided'
+        assert self.params['file_path_prefix'] is not None, 'Parameter "file_path_prefix" should be provided'
+        assert len(self.params['tile_shape']) == 2, 'Parameter "tile_shape" should contain the number of values of the Y-axis and the X-axis'
+
+        # axes
+        self.axes = {
+            'X' : {
+                'var'   : self.params['X']['var'],
+                'val'   : get_axis_values(self.params['X'])
+            },
+            'Y' : {
+                'var'   : self.params['Y']['var'],
+                'val'   : get_axis_values(self.params['Y'])
+            }
+        }
+
+        # data file and directory of the tiles, keyed by the function and the parameters of the sweep
+        self.file_path = get_file_path(
+            file_path_prefix=self.params['file_path_prefix'],
+            params_axes=self.params
+        )
+        self.dir_tiles = self.file_path[:-4] + '_tiles_' + get_cache_key(get_func_name(self.func), self.params_system, self.params['X'], self.params['Y'], self.params['tile_shape'], self.params.get('metadata'))[:16]
+        self.buffer_path = os.path.join(self.dir_tiles, 'V.npy')
+        self.store_path = self.file_path[:-4]
+
+        # initialize variables
+        self.tiles = None
+        self.results = dict()
+
+    def get_tiles(self):
+        """Method to obtain the tiles of the grid in the order of dispatch.
+
+        Returns
+        -------
+        tiles : list
+            Tiles formatted as ``(y_min, y_max, x_min, x_max)``, where the maximum indices are exclusive.
+        """
+
+        # partition once
+        if self.tiles is not None:
+            return self.tiles
+
+        # extract frequently used variables
+        y_dim, x_dim = len(self.axes['Y']['val']), len(self.axes['X']['val'])
+        y_step = self.params['tile_shape'][0] if self.params['tile_shape'][0] is not None else y_dim
+        x_step = self.params['tile_shape'][1] if self.params['tile_shape'][1] is not None else x_dim
+
+        self.tiles = [(y_min, min(y_min + y_step, y_dim), x_min, min(x_min + x_step, x_dim)) for y_min in range(0, y_dim, y_step) for x_min in range(0, x_dim, x_step)]
+
+        return self.tiles
+
+    def get_tile_path(self, tile):
+        """Method to obtain the path of the checkpoint marker of a tile.
+
+        Parameters
+        ----------
+        tile : tuple
+            Tile formatted as ``(y_min, y_max, x_min, x_max)``.
+
+        Returns
+        -------
+        tile_path : str
+            Path of the checkpoint marker.
+        """
+
+        return os.path.join(self.dir_tiles, 'tile_{}_{}_{}_{}.done'.format(*tile))
+
+    def get_buffer(self, shape_point=None):
+        """Method to obtain the memory-mapped buffer of the results, creating it if it does not exist.
+
+        Parameters
+        ----------
+        shape_point : tuple, optional
+            Shape of the results of a point, required to create the buffer.
+
+        Returns
+        -------
+        V : numpy.memmap
+            Read-only buffer of the results with shape ``(Y, X, n)``, where the slots of the points yet to be evaluated are ``NaN``.
+        """
+
+        if not os.path.isfile(self.buffer_path):
+            # create under a temporary name and link it, so that concurrent processes share the first buffer
+            tmp_path = self.buffer_path[:-4] + '.{}_{}.tmp'.format(socket.gethostname(), os.getpid())
+            V = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float_, shape=(len(self.axes['Y']['val']), len(self.axes['X']['val'])) + tuple(shape_point))
+            V[:] = np.nan
+            V.flush()
+            del V
+            try:
+                os.link(tmp_path, self.buffer_path)
+            except FileExistsError:
+                pass
+            os.remove(tmp_path)
+
+        return np.load(self.buffer_path, mmap_mode='r')
+
+    def run_tile(self, tile):
+        """Method to evaluate the points of a tile in place and write its checkpoint marker.
+
+        The values are written to the byte ranges of their slots instead of through a writable memory map, so that the pages shared by the slots of different tiles are not written back by multiple processes.
+
+        Parameters
+        ----------
+        tile : tuple
+            Tile formatted as ``(y_min, y_max, x_min, x_max)``.
+
+        Returns
+        -------
+        tile : tuple
+            Evaluated tile.
+        """
+
+        # extract frequently used variables
+        y_min, y_max, x_min, x_max = tile
+        ys = self.axes['Y']['val']
+        xs = self.axes['X']['val']
+
+        # evaluate points and write their slots
+        file = None
+        try:
+            for i in range(y_min, y_max):
+                params_y = get_params_updated(self.params_system, self.params['Y'], ys[i])
+                for j in range(x_min, x_max):
+                    value = np.asarray(self.func(get_params_updated(params_y, self.params['X'], xs[j])), dtype=np.float_)
+                    if file is None:
+                        V = self.get_buffer(value.shape)
+                        file = open(self.buffer_path, 'r+b')
+                    assert value.shape == V.shape[2:], 'Results of each point should have the shape {}'.format(V.shape[2:])
+                    file.seek(V.offset + i * V.strides[0] + j * V.strides[1])
+                    file.write(value.tobytes())
+            # the marker is created only after the values reach the disk
+            if file is not None:
+                file.flush()
+                os.fsync(file.fileno())
+        finally:
+            if file is not None:
+                file.close()
+        open(self.get_tile_path(tile), 'w').close()
+
+        return tile
+
+    def is_stored(self):
+        """Method to check whether the results of the sweep are stored.
+
+        Returns
+        -------
+        is_stored : bool
+            Whether the data store or the data file exists.
+        """
+
+        return os.path.isdir(self.store_path) or os.path.isfile(self.file_path)
+
+    def load(self):
+        """Method to load the stored results of the sweep.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Results with shape ``(Y, X, n)``, memory-mapped from the data store if it exists.
+        """
+
+        return load_values(self.file_path)
+
+    def merge(self):
+        """Method to move the buffer into the data store and remove the directory of the tiles.
+
+        Returns
+        -------
+        V : numpy.memmap
+            Results with shape ``(Y, X, n)``.
+        """
+
+        # move the buffer and remove the tiles
+        save_sweep(
+            store_path=self.store_path,
+            X=self.axes['X']['val'],
+            Y=self.axes['Y']['val'],
+            V=self.buffer_path,
+            params=dict(self.params['metadata'], X=self.params['X'], Y=self.params['Y'], system=self.params_system)
+        )
+        shutil.rmtree(self.dir_tiles)
+
+        return self.load()
+
+    def loop(self):
+        """Method to loop over the remaining tiles and merge them into the data store.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with keys ``'X'`` and ``'Y'`` (values of the axes) and ``'V'`` (results with shape ``(Y, X, n)``).
+        """
+
+        # load existing data
+        if self.is_stored():
+            V = self.load()
+
+        else:
+            # remaining tiles
+            os.makedirs(self.dir_tiles, exist_ok=True)
+            tiles = self.get_tiles()
+            tiles_remaining = [tile for tile in tiles if not os.path.isfile(self.get_tile_path(tile))]
+            num_processes = self.params['num_processes'] if self.params['num_processes'] is not None else os.cpu_count()
+            if self.params['show_progress'] and len(tiles_remaining) < len(tiles):
+                logger.info('Resuming from {} of {} tiles\n'.format(len(tiles) - len(tiles_remaining), len(tiles)))
+
+            # distribute over processes
+            if num_processes > 1 and len(tiles_remaining) > 1:
+                with multiprocessing.Pool(min(num_processes, len(tiles_remaining))) as pool:
+                    for i, _ in enumerate(pool.imap_unordered(self.run_tile, tiles_remaining, chunksize=1)):
+                        if self.params['show_progress']:
+                            logger.info('Completed {} of {} remaining tiles\n'.format(i + 1, len(tiles_remaining)))
+            else:
+                for i, tile in enumerate(tiles_remaining):
+                    self.run_tile(tile)
+                    if self.params['show_progress']:
+                        logger.info('Completed {} of {} remaining tiles\n'.format(i + 1, len(tiles_remaining)))
+
+            # merge tiles
+            V = self.merge()
+
+        # update results
+        self.results = {
+            'X' : self.axes['X']['val'],
+            'Y' : self.axes['Y']['val'],
+            'V' : V
+        }
+
+        return self.results
+
+class DistributedXYLooper(ChunkedXYLooper):
+    """Class to sweep a two-dimensional grid in tiles distributed over the processes of multiple nodes through a queue on a shared file system.
+
+    The tiles of :class:`ChunkedXYLooper` are queued as marker files in the directory of the tiles, which should reside on a file system shared by the nodes. A worker claims a tile by atomically renaming its marker, touches the claim while it evaluates the tile, writes its checkpoint and releases the claim, so that each tile is evaluated at least once irrespective of the number of workers. The coordinator requeues the claims without a live owner, i.e., those of the exited processes on its own node and those not touched within the timeout, queues the remaining tiles, runs local workers and merges the tiles once all of them are available. On the other nodes, the same script is run with the role ``'worker'``, whose processes evaluate the queued tiles and load the results once they are merged. With a local directory and no other nodes, the queue runs as a stand-in on a single node.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the results of a point as an array, formatted as ``func(system_params)``.
+    params : dict
+        Parameters for the looper. The looper parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        X                   (*dict*) parameters of the X-axis with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` and optionally ``'idx'`` and ``'scale'``.
+        Y                   (*dict*) parameters of the Y-axis with keys ``'var'``, ``'min'``, ``'max'``, ``'dim'`` and optionally ``'idx'`` and ``'scale'``.
+        file_path_prefix    (*str*) prefix of the path of the data file on the shared file system.
+        metadata            (*dict*) additional parameters written to the header of the data store, e.g., those of the solver. Default is ``{}``.
+        tile_shape          (*tuple*) number of values of the Y-axis and the X-axis in each tile, where ``None`` denotes all the values. Default is ``(1, None)``.
+        role                (*str*) role of the process, either ``'coordinator'`` or ``'worker'``. Default is ``'coordinator'``.
+        num_processes       (*int*) number of local workers. Default is the number of CPUs.
+        poll_interval       (*float*) interval in seconds between consecutive checks of the queue. Default is :math:`1.0`.
+        timeout             (*float*) time in seconds after which a claim that is not touched by its owner is requeued by the coordinator. If ``None``, only the claims of the exited processes on the node of the coordinator are requeued. Default is :math:`60.0`.
+        show_progress       (*bool*) option to log the progress. Default is ``False``.
+        ================    ====================================================
+    params_system : dict
+        Parameters of the system.
+    """
+
+    # default looper parameters
+    looper_defaults = {
+        'X'                 : None,
+        'Y'                 : None,
+        'file_path_prefix'  : None,
+        'metadata'          : {},
+        'tile_shape'        : (1, None),
+        'role'              : 'coordinator',
+        'num_processes'     : None,
+        'poll_interval'     : 1.0,
+        'timeout'           : 60.0,
+        'show_progress'     : False
+    }
+
+    def __init__(self, func, params, params_system):
+        """Class constructor for DistributedXYLooper."""
+
+        # initialize super class
+        super().__init__(
+            func=func,
+            params=params,
+            params_system=params_system
+        )
+
+        # validate parameters
+        assert self.params['role'] in ['coordinator', 'worker'], 'Parameter "role" should be either "coordinator" or "worker"'
+        assert self.params['timeout'] is None or self.params['timeout'] > self.params['poll_interval'], 'Parameter "timeout" should exceed "poll_interval"'
+
+        # directories of the queued and claimed tiles
+        self.dir_queued = os.path.join(self.dir_tiles, 'queued')
+        self.dir_claimed = os.path.join(self.dir_tiles, 'claimed')
+
+    def get_tile_name(self, tile):
+        """Method to obtain the name of the marker of a tile.
+
+        Parameters
+        ----------
+        tile : tuple
+            Tile formatted as ``(y_min, y_max, x_min, x_max)``.
+
+        Returns
+        -------
+        tile_name : str
+            Name of the marker.
+        """
+
+        return 'tile_{}_{}_{}_{}.json'.format(*tile)
+
+    def queue(self):
+        """Method to queue the tiles that are neither evaluated, queued nor claimed.
+
+        Returns
+        -------
+        num_queued : int
+            Number of newly queued tiles.
+        """
+
+        os.makedirs(self.dir_queued, exist_ok=True)
+        os.makedirs(self.dir_claimed, exist_ok=True)
+
+        # claims of a previous run
+        self.requeue()
+        names_claimed = set([name.split('.json')[0] + '.json' for name in os.listdir(self.dir_claimed)])
+
+        # write markers atomically
+        num_queued = 0
+        for tile in self.get_tiles():
+            name = self.get_tile_name(tile)
+            marker_path = os.path.join(self.dir_queued, name)
+            if os.path.isfile(self.get_tile_path(tile)) or os.path.isfile(marker_path) or name in names_claimed:
+                continue
+            tmp_path = marker_path + '.{}.tmp'.format(os.getpid())
+            with open(tmp_path, 'w') as file:
+                json.dump(list(tile), file)
+            os.replace(tmp_path, marker_path)
+            num_queued += 1
+
+        return num_queued
+
+    def claim(self):
+        """Method to claim a queued tile.
+
+        Returns
+        -------
+        tile : tuple
+            Claimed tile formatted as ``(y_min, y_max, x_min, x_max)``. ``None`` if no tile is queued.
+        claim_path : str
+            Path of the marker of the claimed tile. ``None`` if no tile is queued.
+        """
+
+        # queue is removed after merging
+        try:
+            names = set([name for name in os.listdir(self.dir_queued) if name.endswith('.json')])
+        except FileNotFoundError:
+            return None, None
+        # order of dispatch
+        names = [name for name in [self.get_tile_name(tile) for tile in self.get_tiles()] if name in names]
+
+        # the first successful rename claims the tile
+        for name in names:
+            claim_path = os.path.join(self.dir_claimed, '{}.{}_{}'.format(name, socket.gethostname(), os.getpid()))
+            try:
+                os.rename(os.path.join(self.dir_queued, name), claim_path)
+            except OSError:
+                continue
+            # the time of the claim is used for the timeout
+            os.utime(claim_path)
+            with open(claim_path, 'r') as file:
+                return tuple(json.load(file)), claim_path
+
+        return None, None
+
+    def is_claim_alive(self, name, t_now):
+        """Method to check whether the owner of a claim is alive.
+
+        Parameters
+        ----------
+        name : str
+            Name of the claim, formatted as ``'{tile_name}.{host}_{pid}'``.
+        t_now : float
+            Current time in seconds.
+
+        Returns
+        -------
+        is_alive : bool
+            Option denoting whether the owning process exists on the node of this process, or whether the claim was touched within the timeout on the other nodes.
+        """
+
+        # owner on this node
+        host, pid = name.split('.json.', 1)[1].rsplit('_', 1)
+        if host == socket.gethostname() and os.name == 'posix':
+            try:
+                os.kill(int(pid), 0)
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                pass
+            except ValueError:
+                return False
+
+        # owner on another node
+        if self.params['timeout'] is None:
+            return True
+        return t_now - os.path.getmtime(os.path.join(self.dir_claimed, name)) <= self.params['timeout']
+
+    def requeue(self):
+        """Method to requeue the claimed tiles without a live owner.
+
+        Returns
+        -------
+        num_requeued : int
+            Number of requeued tiles.
+        """
+
+        # extract frequently used variables
+        t_now = time.time()
+
+        num_requeued = 0
+        for name in os.listdir(self.dir_claimed):
+            try:
+                if not self.is_claim_alive(name, t_now):
+                    os.replace(os.path.join(self.dir_claimed, name), os.path.join(self.dir_queued, name.split('.json')[0] + '.json'))
+                    num_requeued += 1
+            except FileNotFoundError:
+                continue
+
+        if self.params['show_progress'] and num_requeued > 0:
+            logger.info('Requeued {} tiles without a live owner\n'.format(num_requeued))
+
+        return num_requeued
+
+    def touch(self, claim_path, event):
+        """Method to touch a claim periodically until an event is set.
+
+        Parameters
+        ----------
+        claim_path : str
+            Path of the claim.
+        event : :class:`threading.Event`
+            Event set once the tile is evaluated.
+        """
+
+        while not event.wait(self.params['poll_interval']):
+            try:
+                os.utime(claim_path)
+            except FileNotFoundError:
+                return
+
+    def release(self, tile, claim_path, is_done):
+        """Method to release a claim.
+
+        Parameters
+        ----------
+        tile : tuple
+            Claimed tile formatted as ``(y_min, y_max, x_min, x_max)``.
+        claim_path : str
+            Path of the claim.
+        is_done : bool
+            Option denoting whether the tile is evaluated. If ``False``, the tile is queued again.
+        """
+
+        # the claim may have been requeued or merged meanwhile
+        try:
+            if is_done:
+                os.remove(claim_path)
+            else:
+                os.replace(claim_path, os.path.join(self.dir_queued, self.get_tile_name(tile)))
+        except FileNotFoundError:
+            pass
+
+    def is_evaluated(self):
+        """Method to check whether all the tiles are evaluated.
+
+        Returns
+        -------
+        is_evaluated : bool
+            Option denoting whether the data store, the data file or the checkpoints of all the tiles exist.
+        """
+
+        return self.is_stored() or all([os.path.isfile(self.get_tile_path(tile)) for tile in self.get_tiles()])
+
+    def work(self):
+        """Method to evaluate the queued tiles until all the tiles are evaluated.
+
+        Returns
+        -------
+        num_tiles : int
+            Number of tiles evaluated by this worker.
+        """
+
+        num_tiles = 0
+        while not self.is_evaluated():
+            tile, claim_path = self.claim()
+
+            # remaining tiles are claimed elsewhere or not queued yet
+            if tile is None:
+                time.sleep(self.params['poll_interval'])
+                continue
+
+            # touch the claim while evaluating and release it in any case
+            event = threading.Event()
+            thread = threading.Thread(target=self.touch, args=(claim_path, event), daemon=True)
+            thread.start()
+            is_done = False
+            try:
+                self.run_tile(tile)
+                is_done = True
+            except FileNotFoundError:
+                # the tiles were merged while a requeued tile was evaluated
+                if self.is_stored():
+                    break
+                raise
+            finally:
+                event.set()
+                thread.join()
+                self.release(tile, claim_path, is_done)
+            num_tiles += 1
+
+        return num_tiles
+
+    def loop(self):
+        """Method to evaluate the tiles in the role of the process and merge them into the data store.
+
+        Returns
+        -------
+        results : dict
+            Results of the looper with keys ``'X'`` and ``'Y'`` (values of the axes) and ``'V'`` (results with shape ``(Y, X, n)``).
+        """
+
+        if not self.is_stored():
+            # queue the remaining tiles as the coordinator
+            num_tiles = len(self.get_tiles())
+            if self.params['role'] == 'coordinator':
+                num_queued = self.queue()
+                if self.params['show_progress']:
+                    logger.info('Queued {} of {} tiles in {}\n'.format(num_queued, num_tiles, self.dir_tiles))
+
+            # local workers
+            num_processes = self.params['num_processes'] if self.params['num_processes'] is not None else os.cpu_count()
+            processes = [multiprocessing.Process(target=self.work) for _ in range(num_processes)]
+            for process in processes:
+                process.start()
+
+            # wait for the coordinator to merge the tiles
+            if self.params['role'] == 'worker':
+                for process in processes:
+                    process.join()
+                while not self.is_stored():
+                    time.sleep(self.params['poll_interval'])
+
+            else:
+                # wait for the tiles
+                num_done = -1
+                while True:
+                    _num_done = sum([os.path.isfile(self.get_tile_path(tile)) for tile in self.get_tiles()])
+                    if self.params['show_progress'] and _num_done != num_done:
+                        logger.info('Evaluated {} of {} tiles\n'.format(_num_done, num_tiles))
+                    num_done = _num_done
+                    if num_done == num_tiles:
+                        break
+                    self.requeue()
+                    if len(processes) > 0 and all([process.exitcode not in [None, 0] for process in processes]):
+                        raise RuntimeError('All local workers of {} failed'.format(self.dir_tiles))
+                    time.sleep(self.params['poll_interval'])
+
+                for process in processes:
+                    process.join()
+
+                # merge tiles
+                self.merge()
+
+        return super().loop()
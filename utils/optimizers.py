@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module with optimizers for the parameters of systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import numpy as np
+import scipy.optimize as so
+
+# local modules
+from solvers.stationary import solve_lyapunov
+from utils.loopers import get_params_updated
+
+class SteadyStateOptimizer():
+    r"""Class to minimize a steady-state correlation of a system with a constant drift matrix over a set of its parameters.
+
+    The objective is :math:`10 \log_{10} V_{ij}`, where :math:`V` solves :math:`A V + V A^{T} + D = 0`, so that minimizing it maximizes the squeezing :math:`- 10 \log_{10} V_{ij}` in dB. Its gradient is obtained from the sensitivity equation :math:`A \partial_{p} V + \partial_{p} V A^{T} + \partial_{p} A V + V \partial_{p} A^{T} + \partial_{p} D = 0`, which requires one additional Lyapunov solve per parameter. The derivatives of the drift and noise matrices are obtained by central differences, which are exact up to round-off for matrices that are at most quadratic in the parameters (as is the case for the RWA matrices of :class:`systems.MiddleMembrane.MM_01`).
+
+    Parameters
+    ----------
+    system_class : class
+        Class of the system, instantiated as ``system_class(params=system_params)``.
+    params : dict
+        Parameters for the optimizer. The optimizer parameters are:
+        ============    ========================================================
+        key             meaning
+        ============    ========================================================
+        vars            (*list*) parameters to optimize as dictionaries with keys ``'var'``, ``'min'``, ``'max'`` and optionally ``'idx'`` for list-valued parameters. Default is :math:`[ \beta_{-} \in [0, 200], \beta_{+} \in [0, 200] ]`.
+        index           (*tuple*) index of the correlation to minimize. Default is :math:`(2, 2)`.
+        objective       (*str*) objective to minimize, either ``'lyapunov'`` for the exact steady state with analytical gradients or ``'analytical'`` for ``get_var_Q_ss_rwa`` with numerical gradients. Default is ``'lyapunov'``.
+        method          (*str*) method used by ``scipy.optimize.minimize``. Default is ``'L-BFGS-B'``.
+        tol             (*float*) tolerance of the optimizer. Default is :math:`10^{-10}`.
+        max_iter        (*int*) maximum number of iterations. Default is :math:`200`.
+        penalty         (*float*) value of the objective in dB for unstable or unphysical points. Default is :math:`100.0`.
+        step            (*float*) relative step of the central differences. Default is :math:`10^{-4}`.
+        ============    ========================================================
+    params_system : dict
+        Initial parameters of the system.
+    """
+
+    # default optimizer parameters
+    optimizer_defaults = {
+        'vars'      : [{
+            'var'   : 'betas',
+            'idx'   : 1,
+            'min'   : 0.0,
+            'max'   : 200.0
+        }, {
+            'var'   : 'betas',
+            'idx'   : 2,
+            'min'   : 0.0,
+            'max'   : 200.0
+        }],
+        'index'     : (2, 2),
+        'objective' : 'lyapunov',
+        'method'    : 'L-BFGS-B',
+        'tol'       : 1e-10,
+        'max_iter'  : 200,
+        'penalty'   : 100.0,
+        'step'      : 1e-4
+    }
+
+    def __init__(self, system_class, params, params_system):
+        """Class constructor for SteadyStateOptimizer."""
+
+        # set attributes
+        self.system_class = system_class
+        self.params = dict()
+        for key in self.optimizer_defaults:
+            self.params[key] = params.get(key, self.optimizer_defaults[key])
+        self.params_system = params_system
+
+        # validate parameters
+        assert self.params['objective'] in ['lyapunov', 'analytical'], 'Parameter "objective" should be either "lyapunov" or "analytical"'
+        assert len(self.params['vars']) > 0, 'Parameter "vars" should contain at least one parameter'
+
+        # initialize variables
+        self.num_evals = 0
+        self.results = dict()
+
+    def get_params_system(self, xs):
+        """Method to obtain the system parameters for the values of the optimized parameters.
+
+        Parameters
+        ----------
+        xs : numpy.ndarray
+            Values of the optimized parameters.
+
+        Returns
+        -------
+        params_system : dict
+            Updated copy of the system parameters.
+        """
+
+        params_system = self.params_system
+        for var_params, x in zip(self.params['vars'], xs):
+            params_system = get_params_updated(params_system, var_params, float(x))
+
+        return params_system
+
+    def get_matrices(self, xs):
+        """Method to obtain the drift and noise matrices for the values of the optimized parameters.
+
+        Parameters
+        ----------
+        xs : numpy.ndarray
+            Values of the optimized parameters.
+
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrix.
+        D : numpy.ndarray
+            Noise matrix.
+        """
+
+        system = self.system_class(
+            params=self.get_params_system(xs)
+        )
+        assert system.is_A_constant, 'System should have a constant drift matrix'
+        iv_modes, iv_corrs, c = system.get_ivc()
+
+        return np.array(system.get_A(
+            modes=iv_modes,
+            c=c,
+            t=0.0
+        ), dtype=np.float_), np.array(system.get_D(
+            modes=iv_modes,
+            corrs=iv_corrs,
+            c=c,
+            t=0.0
+        ), dtype=np.float_)
+
+    def get_objective_lyapunov(self, xs):
+        """Method to obtain the objective and its gradient from the steady-state Lyapunov solution.
+
+        Parameters
+        ----------
+        xs : numpy.ndarray
+            Values of the optimized parameters.
+
+        Returns
+        -------
+        objective : float
+            Value of :math:`10 \\log_{10} V_{ij}`.
+        gradient : numpy.ndarray
+            Gradient of the objective.
+        """
+
+        # extract frequently used variables
+        i, j = self.params['index']
+        penalty = self.params['penalty']
+        self.num_evals += 1
+
+        # steady state
+        A, D = self.get_matrices(xs)
+        if np.max(np.real(np.linalg.eigvals(A))) >= 0.0:
+            return penalty, np.zeros(len(xs))
+        V = solve_lyapunov(A, D)
+        if V[i, j] <= 0.0:
+            return penalty, np.zeros(len(xs))
+
+        # sensitivities of the steady state
+        gradient = np.zeros(len(xs), dtype=np.float_)
+        for k in range(len(xs)):
+            h = self.params['step'] * max(abs(xs[k]), 1.0)
+            xs_p = np.array(xs, dtype=np.float_)
+            xs_m = np.array(xs, dtype=np.float_)
+            xs_p[k] += h
+            xs_m[k] -= h
+            A_p, D_p = self.get_matrices(xs_p)
+            A_m, D_m = self.get_matrices(xs_m)
+            dA = (A_p - A_m) / 2.0 / h
+            dD = (D_p - D_m) / 2.0 / h
+            dAV = dA.dot(V)
+            dV = solve_lyapunov(A, dAV + np.transpose(dAV) + dD)
+            gradient[k] = dV[i, j]
+
+        return 10.0 * np.log10(V[i, j]), 10.0 / np.log(10.0) / V[i, j] * gradient
+
+    def get_objective_analytical(self, xs):
+        """Method to obtain the objective from the analytical steady-state variance under RWA.
+
+        Parameters
+        ----------
+        xs : numpy.ndarray
+            Values of the optimized parameters.
+
+        Returns
+        -------
+        objective : float
+            Value of :math:`10 \\log_{10} \\langle Q^{2} \\rangle`.
+        """
+
+        self.num_evals += 1
+
+        # analytical variance
+        system = self.system_class(
+            params=self.get_params_system(xs)
+        )
+        _, _, c = system.get_ivc()
+        var = system.get_var_Q_ss_rwa(
+            c=c
+        )
+
+        return 10.0 * np.log10(var) if np.isfinite(var) and var > 0.0 else self.params['penalty']
+
+    def optimize(self):
+        """Method to optimize the parameters.
+
+        Returns
+        -------
+        results : dict
+            Results of the optimizer with keys ``'xs'`` (optimal values), ``'params_system'`` (optimal system parameters), ``'value'`` (optimal correlation), ``'squeezing'`` (:math:`- 10 \\log_{10}` of the optimal correlation in dB), ``'num_evals'`` (number of evaluations of the objective), ``'success'`` and ``'message'``.
+        """
+
+        # extract frequently used variables
+        vars_params = self.params['vars']
+        xs_0 = list()
+        for var_params in vars_params:
+            val = self.params_system[var_params['var']]
+            xs_0.append(val[var_params['idx']] if var_params.get('idx', None) is not None else val)
+        self.num_evals = 0
+
+        # minimize
+        is_lyapunov = self.params['objective'] == 'lyapunov'
+        result = so.minimize(
+            fun=self.get_objective_lyapunov if is_lyapunov else self.get_objective_analytical,
+            x0=np.array(xs_0, dtype=np.float_),
+            jac=is_lyapunov,
+            method=self.params['method'],
+            bounds=[(var_params['min'], var_params['max']) for var_params in vars_params],
+            tol=self.params['tol'],
+            options={
+                'maxiter': self.params['max_iter']
+            }
+        )
+
+        # update results
+        self.results = {
+            'xs'            : result.x,
+            'params_system' : self.get_params_system(result.x),
+            'value'         : 10.0**(result.fun / 10.0),
+            'squeezing'     : - result.fun,
+            'num_evals'     : self.num_evals,
+            'success'       : bool(result.success),
+            'message'       : str(result.message)
+        }
+
+        return self.results
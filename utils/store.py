@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to store the results of sweeps as memory-mappable arrays."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import json
+import numpy as np
+import os
+import shutil
+import socket
+
+# local modules
+from utils.cache import get_canonical_params
+
+def save_sweep(store_path, X, Y, V, params={}):
+    """Function to save the results of a sweep as a directory of uncompressed arrays with a header of parameters.
+
+    The directory contains the arrays ``X.npy``, ``Y.npy`` and ``V.npy`` and the header ``params.json``. It is written under a temporary name and renamed once complete, so that a partially written store is never read. An existing store is renamed aside before and removed after the new one is renamed in.
+
+    Parameters
+    ----------
+    store_path : str
+        Path of the directory of the store.
+    X : numpy.ndarray
+        Values of the X-axis.
+    Y : numpy.ndarray
+        Values of the Y-axis.
+    V : numpy.ndarray or str
+        Results with shape ``(Y, X, n)``, or the path of a ``.npy`` file of the results, which is moved into the store without copying.
+    params : dict, optional
+        Parameters of the sweep, e.g., those of the axes, the system and the solver.
+    """
+
+    # temporary directory
+    dir_name = os.path.dirname(store_path)
+    if dir_name != '':
+        os.makedirs(dir_name, exist_ok=True)
+    tmp_path = store_path + '.{}_{}.tmp'.format(socket.gethostname(), os.getpid())
+    if os.path.isdir(tmp_path):
+        shutil.rmtree(tmp_path)
+    os.makedirs(tmp_path)
+
+    # arrays
+    np.save(os.path.join(tmp_path, 'X.npy'), np.asarray(X), allow_pickle=False)
+    np.save(os.path.join(tmp_path, 'Y.npy'), np.asarray(Y), allow_pickle=False)
+    if isinstance(V, str):
+        os.replace(V, os.path.join(tmp_path, 'V.npy'))
+    else:
+        np.save(os.path.join(tmp_path, 'V.npy'), np.asarray(V, dtype=np.float_), allow_pickle=False)
+
+    # header
+    with open(os.path.join(tmp_path, 'params.json'), 'w') as file:
+        json.dump(get_canonical_params(params), file, indent=4)
+
+    # replace any existing store, as directories cannot be renamed over non-empty ones
+    old_path = store_path + '.{}_{}.old'.format(socket.gethostname(), os.getpid())
+    if os.path.isdir(store_path):
+        if os.path.isdir(old_path):
+            shutil.rmtree(old_path)
+        os.rename(store_path, old_path)
+    os.rename(tmp_path, store_path)
+    if os.path.isdir(old_path):
+        shutil.rmtree(old_path)
+
+def load_sweep(store_path, mmap_mode='r'):
+    """Function to load the results of a sweep saved by :func:`save_sweep`.
+
+    The results are memory-mapped by default, so that slicing a few rows of the grid reads only those rows from the disk.
+
+    Parameters
+    ----------
+    store_path : str
+        Path of the directory of the store.
+    mmap_mode : str, optional
+        Mode to memory-map the results, as in ``numpy.load``. Default is ``'r'``. If ``None``, the results are loaded into the memory.
+
+    Returns
+    -------
+    sweep : dict
+        Sweep with keys ``'X'`` and ``'Y'`` (values of the axes), ``'V'`` (results with shape ``(Y, X, n)``) and ``'params'`` (parameters of the sweep).
+    """
+
+    with open(os.path.join(store_path, 'params.json'), 'r') as file:
+        params = json.load(file)
+
+    return {
+        'X'         : np.load(os.path.join(store_path, 'X.npy')),
+        'Y'         : np.load(os.path.join(store_path, 'Y.npy')),
+        'V'         : np.load(os.path.join(store_path, 'V.npy'), mmap_mode=mmap_mode),
+        'params'    : params
+    }
+
+def load_values(file_path, mmap_mode='r'):
+    """Function to load the results of a sweep from its data store, or from its data file if the store does not exist.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of the data file named as per the toolbox, e.g., ``'{prefix}_x=beta_pm_sum_75.0_225.0_301.npz'``. The data store is the directory of the same path without the extension.
+    mmap_mode : str, optional
+        Mode to memory-map the results of the data store, as in ``numpy.load``. Default is ``'r'``.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Results of the sweep.
+    """
+
+    # data store
+    store_path = os.path.splitext(file_path)[0]
+    if os.path.isdir(store_path):
+        return load_sweep(store_path, mmap_mode=mmap_mode)['V']
+
+    # data file
+    with np.load(file_path) as data:
+        return data['arr_0']
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module to synthesize the results of sweeps over the thermal occupancies."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-17"
+__updated__ = "2026-10-17"
+
+# dependencies
+import copy
+import numpy as np
+
+# local modules
+from utils.cache import get_cache_key
+
+class ThermalFunction():
+    r"""Class to evaluate a function of the system parameters by superposing its results at the basis of the thermal occupancies.
+
+    For linearized systems whose drift matrix does not depend on the thermal occupancies :math:`[ n_{a}, n_{b} ]`, while their noise matrix and initial correlations are affine in them, the correlations at all times are :math:`V = V_{0} + n_{a} V_{a} + n_{b} V_{b}`. The basis function is therefore evaluated at the occupancies :math:`[ 0, 0 ]`, :math:`[ 1, 0 ]` and :math:`[ 0, 1 ]`, where the latter two are required only for nonzero occupancies, and the results for the other occupancies are synthesized from them. The basis of the last set of the remaining parameters is retained, so that a sweep with the occupancies along its inner axis evaluates the basis once per value of the other parameters, e.g., with tiles of shape ``(None, 1)`` for a Y-axis of ``'ns'``.
+
+    Parameters
+    ----------
+    func_basis : callable
+        Function returning an array that is affine in the thermal occupancies, e.g., the correlations, formatted as ``func_basis(system_params)``.
+    func_values : callable, optional
+        Function returning the results of a point from the synthesized array, formatted as ``func_values(system_params, value)``. If ``None``, the synthesized array is returned.
+    """
+
+    def __init__(self, func_basis, func_values=None):
+        """Class constructor for ThermalFunction."""
+
+        # set attributes
+        self.func_basis = func_basis
+        self.func_values = func_values
+
+        # initialize variables
+        self.key = None
+        self.basis = dict()
+
+    def get_basis(self, system_params, idx=None):
+        """Method to obtain an element of the basis.
+
+        Parameters
+        ----------
+        system_params : dict
+            Parameters of the system at the point.
+        idx : int, optional
+            Index of the thermal occupancy. If ``None``, the result for vanishing occupancies is returned.
+
+        Returns
+        -------
+        value : numpy.ndarray
+            Result for vanishing occupancies or its rate of change with the occupancy.
+        """
+
+        if idx not in self.basis:
+            params = copy.deepcopy(system_params)
+            params['ns'] = [0.0] * len(system_params['ns'])
+            if idx is not None:
+                params['ns'][idx] = 1.0
+            value = np.asarray(self.func_basis(params))
+            self.basis[idx] = value if idx is None else value - self.get_basis(system_params)
+
+        return self.basis[idx]
+
+    def __call__(self, system_params):
+        """Method to obtain the result of a point.
+
+        Parameters
+        ----------
+        system_params : dict
+            Parameters of the system at the point.
+
+        Returns
+        -------
+        value : numpy.ndarray
+            Result of the point.
+        """
+
+        # basis is retained for the same remaining parameters
+        key = get_cache_key({_key: system_params[_key] for _key in system_params if _key != 'ns'})
+        if key != self.key:
+            self.key = key
+            self.basis = dict()
+
+        # superpose
+        value = self.get_basis(system_params)
+        for idx, n in enumerate(system_params['ns']):
+            if n != 0.0:
+                value = value + n * self.get_basis(system_params, idx)
+
+        if self.func_values is None:
+            return value
+
+        return self.func_values(system_params, value)